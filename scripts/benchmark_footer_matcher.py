@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+FooterMatcher Microbenchmark
+Compares the single-pass FooterMatcher against the original per-flag checks
+
+Usage:
+    python scripts/benchmark_footer_matcher.py [--base-path PATH] [--repeat N]
+"""
+
+import os
+import re
+import sys
+import argparse
+import timeit
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from validate_footers import FOOTER_MATCHER, find_readme_files, read_readme  # noqa: E402
+
+def legacy_footer_flags(content: str) -> Dict[str, bool]:
+    """Footer flags as computed before FooterMatcher (one scan per check)"""
+    return {
+        "has_tiation_link": "tiation.github.io" in content,
+        "has_enterprise_mention": any(word in content.lower() for word in ["enterprise", "enterprise-grade"]),
+        "has_ngo_mention": any(phrase in content.lower() for phrase in ["chasewhiterabbit", "ngo", "chase white rabbit"]),
+        "has_footer_section": bool(re.search(r'---\s*$', content, re.MULTILINE)),
+        "has_centered_footer": "<div align=\"center\">" in content or "align=\"center\"" in content,
+        "has_built_with": "built with" in content.lower() or "powered by" in content.lower(),
+    }
+
+def synthetic_corpus() -> List[str]:
+    """Small, large, footer-less and footer-heavy README bodies"""
+    body = "## Section\n\nSome text about the project and how to run it.\n\n" * 40
+    footer = ("\n---\n\n<div align=\"center\">\n**Built with care by ChaseWhiteRabbit NGO**\n"
+              "[Enterprise](https://tiation.github.io/)\n</div>\n")
+    return [
+        body,
+        body + footer,
+        body * 50,
+        body * 50 + footer,
+        footer * 20,
+    ]
+
+def load_corpus(base_path: str) -> List[str]:
+    """Read every README under base_path that decodes cleanly"""
+    corpus = []
+    for file_path in find_readme_files(base_path):
+        try:
+            corpus.append(read_readme(file_path))
+        except Exception:
+            continue
+    return corpus
+
+def main():
+    """Run the microbenchmark and print per-implementation timings"""
+    parser = argparse.ArgumentParser(description="Benchmark FooterMatcher against the legacy checks")
+    parser.add_argument("--base-path", default=None,
+                        help="Use the READMEs under this path instead of the synthetic corpus")
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="Number of passes over the corpus per measurement")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.base_path) if args.base_path else synthetic_corpus()
+    total_chars = sum(len(text) for text in corpus)
+
+    mismatches = [i for i, text in enumerate(corpus) if FOOTER_MATCHER.scan(text) != legacy_footer_flags(text)]
+    if mismatches:
+        print(f"❌ FooterMatcher disagrees with the legacy checks on {len(mismatches)} documents")
+        return 1
+
+    print(f"📚 Corpus: {len(corpus)} documents, {total_chars} chars, {args.repeat} passes")
+    timings = {}
+    for name, func in (("legacy", legacy_footer_flags), ("matcher", FOOTER_MATCHER.scan)):
+        seconds = min(timeit.repeat(lambda: [func(text) for text in corpus], number=args.repeat, repeat=3))
+        timings[name] = seconds
+        rate = total_chars * args.repeat / seconds / 1e6
+        print(f"   - {name}: {seconds:.3f}s ({rate:.1f} Mchars/s)")
+
+    print(f"⚡ Speedup: {timings['legacy'] / timings['matcher']:.2f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Footer Validator Benchmark
+Times discovery, analysis and reporting of validate_footers on a synthetic workspace
+
+Usage:
+    python scripts/benchmark_validate_footers.py [--repos N] [--save-baseline FILE] [--baseline FILE]
+"""
+
+import os
+import sys
+import json
+import random
+import shutil
+import argparse
+import resource
+import tempfile
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from validate_footers import (CANONICAL_FOOTER, FooterStats, find_readme_files,  # noqa: E402
+                              render_report, validate_all_footers)
+
+PHASES = ("discover", "analyze", "report")
+DEFAULT_THRESHOLD = 0.10
+# Slowdowns smaller than this many milliseconds are timer noise whatever their ratio
+DEFAULT_MIN_DELTA_MS = 5.0
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process so far, in KiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux KiB
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+def readme_body(rng: random.Random, size: int, with_footer: bool) -> str:
+    """README text of roughly size characters, optionally ending in the canonical footer"""
+    section = "## Section\n\nSome text about the project, how to build it and how to run it.\n\n"
+    body = "# Project\n\n" + section * max(1, size // len(section))
+    if with_footer:
+        body += "\n" + CANONICAL_FOOTER
+    elif rng.random() < 0.5:
+        body += "\n---\n\n## License\n\nMIT\n"
+    return body
+
+def generate_workspace(root: str, repos: int, depth: int, mean_size: int,
+                       footer_fraction: float, node_modules: int, seed: int) -> Dict:
+    """Create a synthetic workspace under root and describe what was written
+
+    Each repository gets a top-level README and nested READMEs down to
+    depth directories. README sizes follow a log-normal distribution
+    around mean_size. node_modules READMEs are noise the walk must prune.
+    """
+    rng = random.Random(seed)
+    readmes = 0
+    total_bytes = 0
+    for repo in range(repos):
+        repo_path = os.path.join(root, f"repo-{repo:04d}")
+        directories = [repo_path]
+        path = repo_path
+        for level in range(depth):
+            path = os.path.join(path, f"level{level}")
+            directories.append(path)
+        directories.append(os.path.join(repo_path, "docs"))
+
+        for directory in directories:
+            os.makedirs(directory, exist_ok=True)
+            size = int(rng.lognormvariate(0, 0.8) * mean_size)
+            text = readme_body(rng, size, rng.random() < footer_fraction)
+            with open(os.path.join(directory, "README.md"), "w", encoding="utf-8") as f:
+                f.write(text)
+            readmes += 1
+            total_bytes += len(text.encode("utf-8"))
+
+        for package in range(node_modules):
+            package_path = os.path.join(repo_path, "node_modules", f"pkg-{package}")
+            os.makedirs(package_path, exist_ok=True)
+            with open(os.path.join(package_path, "README.md"), "w", encoding="utf-8") as f:
+                f.write(readme_body(rng, mean_size, False))
+
+    return {"readmes": readmes, "bytes": total_bytes}
+
+def run_phases(base_path: str, jobs: int) -> Dict:
+    """Time each validator phase once on base_path"""
+    phases = {}
+
+    start = time.perf_counter()
+    readme_files = find_readme_files(base_path)
+    phases["discover"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = validate_all_footers(base_path, jobs=jobs, readme_files=readme_files)
+    phases["analyze"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    stats = FooterStats().update(results.items())
+    with open(os.devnull, "w", encoding="utf-8") as out:
+        render_report(stats, out)
+    json.dumps(results, indent=2, ensure_ascii=False)
+    phases["report"] = time.perf_counter() - start
+
+    return {"files": len(readme_files), "phases": phases}
+
+def measure(base_path: str, jobs: int, repeat: int) -> Dict:
+    """Best-of-repeat phase timings plus throughput and peak RSS"""
+    best = {}
+    files = 0
+    for _ in range(repeat):
+        run = run_phases(base_path, jobs)
+        files = run["files"]
+        for phase, seconds in run["phases"].items():
+            best[phase] = min(seconds, best.get(phase, seconds))
+    total = sum(best.values())
+    return {
+        "files": files,
+        "phases": best,
+        "total": total,
+        "files_per_sec": files / total if total else 0.0,
+        "peak_rss_kb": peak_rss_kb(),
+    }
+
+def compare(baseline: Dict, current: Dict, threshold: float,
+            min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> List[str]:
+    """Describe every metric that is more than threshold worse than the baseline
+
+    Times (and files/sec, which follows the total time) must also be at
+    least min_delta_ms slower before they count as a regression.
+    """
+    regressions = []
+    min_delta = min_delta_ms / 1000
+    checks = [(f"{phase} time", baseline["phases"].get(phase), current["phases"][phase], min_delta)
+              for phase in PHASES]
+    checks.append(("total time", baseline.get("total"), current["total"], min_delta))
+    checks.append(("peak RSS", baseline.get("peak_rss_kb"), current["peak_rss_kb"], 0))
+    for name, old, new, floor in checks:
+        if old and new > old * (1 + threshold) and new - old >= floor:
+            regressions.append(f"{name}: {old:.4g} -> {new:.4g} (+{(new / old - 1) * 100:.1f}%)")
+    old_rate = baseline.get("files_per_sec")
+    total_slowdown = current["total"] - baseline.get("total", 0)
+    if old_rate and current["files_per_sec"] < old_rate * (1 - threshold) and total_slowdown >= min_delta:
+        regressions.append(f"files/sec: {old_rate:.1f} -> {current['files_per_sec']:.1f} "
+                           f"({(current['files_per_sec'] / old_rate - 1) * 100:.1f}%)")
+    return regressions
+
+def main():
+    """Generate the workspace, run the benchmark and compare against a baseline"""
+    parser = argparse.ArgumentParser(description="Benchmark validate_footers on a synthetic workspace")
+    parser.add_argument("--repos", type=int, default=200, help="Number of repositories to generate")
+    parser.add_argument("--depth", type=int, default=3, help="Nested README directories per repository")
+    parser.add_argument("--mean-size", type=int, default=4000, help="Typical README size in characters")
+    parser.add_argument("--footer-fraction", type=float, default=0.3,
+                        help="Share of READMEs that end in the canonical footer")
+    parser.add_argument("--node-modules", type=int, default=20,
+                        help="node_modules packages with READMEs per repository (pruned noise)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the workspace layout")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Worker threads for the analysis phase")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; the best is kept")
+    parser.add_argument("--workspace", default=None,
+                        help="Generate into this directory and keep it instead of a temporary one")
+    parser.add_argument("--save-baseline", metavar="FILE", default=None, help="Write the results as a JSON baseline")
+    parser.add_argument("--baseline", metavar="FILE", default=None, help="Compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Relative slowdown counted as a regression (default: 0.10)")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA_MS, metavar="MS",
+                        help="Smallest absolute slowdown in milliseconds counted as a regression (default: 5)")
+    args = parser.parse_args()
+
+    config = {key: getattr(args, key) for key in
+              ("repos", "depth", "mean_size", "footer_fraction", "node_modules", "seed", "jobs")}
+    root = args.workspace or tempfile.mkdtemp(prefix="footer-bench-")
+    try:
+        workspace = generate_workspace(root, args.repos, args.depth, args.mean_size,
+                                       args.footer_fraction, args.node_modules, args.seed)
+        print(f"📁 Workspace: {workspace['readmes']} READMEs, {workspace['bytes']:,} bytes in {root}")
+        result = measure(root, max(args.jobs, 1), max(args.repeat, 1))
+    finally:
+        if args.workspace is None:
+            shutil.rmtree(root, ignore_errors=True)
+    result["config"] = config
+
+    for phase in PHASES:
+        print(f"   - {phase}: {result['phases'][phase]:.3f}s")
+    print(f"⚡ {result['files_per_sec']:.1f} files/s, peak RSS {result['peak_rss_kb'] / 1024:.1f} MiB")
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"💾 Baseline saved to: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("config") != config:
+            print("⚠️  Baseline was recorded with a different workspace configuration")
+        regressions = compare(baseline, result, args.threshold, args.min_delta)
+        if regressions:
+            print(f"❌ {len(regressions)} regressions over {args.threshold * 100:.0f}%:")
+            for regression in regressions:
+                print(f"   - {regression}")
+            return 1
+        print(f"✅ No regressions over {args.threshold * 100:.0f}% against {args.baseline}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
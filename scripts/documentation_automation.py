@@ -18,12 +18,23 @@ import logging
 import argparse
 import ast
 import re
+import time
+import hashlib
+import sqlite3
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime
 import requests
 from dataclasses import dataclass
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from workspace_walker import DEFAULT_EXCLUDE_FILE, WorkspaceWalker  # noqa: E402
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +46,246 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Directory names never entered, whatever the exclude file says
+DEFAULT_EXCLUDE_DIRS = ["venv", ".venv", "__pycache__", "node_modules", "build", ".git"]
+
+# Below this many Python files, starting worker processes costs more than it saves
+PARALLEL_MIN_FILES = 100
+# Upper bound on files sent to a worker per task
+MAX_CHUNK_FILES = 64
+# ast.parse is not thread-safe in CPython 3.11 ("AST constructor recursion depth mismatch"),
+# so the repository threads take turns parsing in this process. Worker processes are
+# single-threaded and never take it.
+_PARSE_LOCK = threading.Lock()
+# The pool is started from a repository thread; forking this multi-threaded process could
+# copy locks held by other threads, so workers come from a forkserver (or spawn) instead
+_POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+# Bump whenever the per-file counting rules change; cached counts from other versions are not used
+ANALYZER_VERSION = "1"
+# Per-file results kept in the coverage cache before the least recently used are evicted
+DEFAULT_CACHE_MAX_ENTRIES = 200000
+
+# Simple regex patterns for function detection
+JS_FUNCTION_PATTERNS = [
+    re.compile(r'function\s+\w+\s*\('),
+    re.compile(r'const\s+\w+\s*=\s*\('),
+    re.compile(r'export\s+function\s+\w+\s*\('),
+    re.compile(r'\w+\s*:\s*function\s*\('),
+    re.compile(r'\w+\s*:\s*\([^)]*\)\s*=>')
+]
+JSDOC_PATTERN = re.compile(r'/\*\*[\s\S]*?\*/')
+
+def python_file_counts(py_file: str) -> Tuple[int, int, int, int]:
+    """Count functions, documented functions, classes and documented classes in one Python file."""
+    with open(py_file, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    
+    total_functions = documented_functions = total_classes = documented_classes = 0
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef):
+            total_functions += 1
+            if ast.get_docstring(node):
+                documented_functions += 1
+        elif isinstance(node, ast.ClassDef):
+            total_classes += 1
+            if ast.get_docstring(node):
+                documented_classes += 1
+    return total_functions, documented_functions, total_classes, documented_classes
+
+def python_chunk_counts(py_files: List[str]) -> List[Tuple[Optional[Tuple[int, int, int, int]], Optional[str]]]:
+    """Per-file (counts, error) for a chunk of files; runs in the worker processes."""
+    results = []
+    for py_file in py_files:
+        try:
+            results.append((python_file_counts(py_file), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+def javascript_file_counts(js_file: str) -> Tuple[int, int]:
+    """Count functions and JSDoc comments in one JavaScript/TypeScript file."""
+    with open(js_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+    
+    total_functions = sum(len(pattern.findall(content)) for pattern in JS_FUNCTION_PATTERNS)
+    return total_functions, len(JSDOC_PATTERN.findall(content))
+
+def javascript_chunk_counts(js_files: List[str]) -> List[Tuple[Optional[Tuple[int, int]], Optional[str]]]:
+    """Per-file (counts, error) for a list of JavaScript/TypeScript files."""
+    results = []
+    for js_file in js_files:
+        try:
+            results.append((javascript_file_counts(js_file), None))
+        except Exception as e:
+            results.append((None, str(e)))
+    return results
+
+def file_digest(path: str) -> str:
+    """Content hash used as the coverage cache key."""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+class CoverageCache:
+    """Content-addressed SQLite store of per-file documentation counts.
+    
+    Rows are keyed by file kind, ANALYZER_VERSION and the hash of the file's
+    bytes, so an unchanged file is never parsed again wherever it lives, and
+    a change to the counting rules misses every old row. Parse errors are
+    cached too; Python rows also carry the interpreter version, since what
+    ast.parse accepts changes between Python releases. The repository threads share one connection behind a lock;
+    results are queued and written on close, when the table is trimmed to
+    the max_entries most recently used rows.
+    """
+    
+    SCHEMA_VERSION = 1
+    # Stay below SQLite's bound parameter limit
+    LOOKUP_BATCH = 500
+    
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.now = time.time()
+        self._lock = threading.Lock()
+        self._pending = []
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS coverage_cache")
+            self.conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS coverage_cache (
+                kind TEXT NOT NULL,
+                analyzer_version TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                counts TEXT,
+                error TEXT,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (kind, analyzer_version, digest)
+            );
+            CREATE INDEX IF NOT EXISTS coverage_cache_last_used ON coverage_cache (last_used);
+        """)
+    
+    @staticmethod
+    def _version(kind: str) -> str:
+        """Analyzer version stored for a kind, including the parsing interpreter for Python."""
+        if kind == "python":
+            return f"{ANALYZER_VERSION}-py{sys.version_info[0]}.{sys.version_info[1]}"
+        return ANALYZER_VERSION
+    
+    def lookup(self, kind: str, digests: List[str]) -> Dict[str, Tuple[Optional[Tuple[int, ...]], Optional[str]]]:
+        """Cached (counts, error) by digest, counting a hit or miss per entry of digests."""
+        unique = list(dict.fromkeys(digests))
+        version = self._version(kind)
+        found = {}
+        with self._lock:
+            for i in range(0, len(unique), self.LOOKUP_BATCH):
+                batch = unique[i:i + self.LOOKUP_BATCH]
+                rows = self.conn.execute(
+                    f"SELECT digest, counts, error FROM coverage_cache WHERE kind = ? AND analyzer_version = ? "
+                    f"AND digest IN ({', '.join('?' * len(batch))})",
+                    [kind, version] + batch).fetchall()
+                for digest, counts, error in rows:
+                    found[digest] = (tuple(json.loads(counts)) if counts is not None else None, error)
+                    self._pending.append((kind, version, digest, counts, error, self.now))
+            hits = sum(1 for digest in digests if digest in found)
+            self.hits += hits
+            self.misses += len(digests) - hits
+        return found
+    
+    def store(self, kind: str, results: Dict[str, Tuple[Optional[Tuple[int, ...]], Optional[str]]]):
+        """Queue freshly computed (counts, error) by digest for writing."""
+        version = self._version(kind)
+        rows = [(kind, version, digest, json.dumps(counts) if counts is not None else None, error, self.now)
+                for digest, (counts, error) in results.items()]
+        with self._lock:
+            self._pending.extend(rows)
+    
+    @property
+    def hit_rate(self) -> float:
+        """Share of looked-up files served from the cache, 0-100."""
+        total = self.hits + self.misses
+        return self.hits / total * 100 if total else 0.0
+    
+    def close(self):
+        """Flush queued rows, evict the least recently used beyond max_entries and close the database."""
+        with self._lock:
+            with self.conn:
+                self.conn.executemany("INSERT OR REPLACE INTO coverage_cache VALUES (?, ?, ?, ?, ?, ?)",
+                                      self._pending)
+                self.conn.execute("""
+                    DELETE FROM coverage_cache WHERE rowid IN (
+                        SELECT rowid FROM coverage_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                    )""", (self.max_entries,))
+            self._pending = []
+            self.conn.close()
+
+class RepoInventory:
+    """Every file and directory of one repository, collected in a single os.scandir pass.
+    
+    Files are indexed by extension and by basename so that language
+    detection, the per-language analyzers, README lookup and API doc checks
+    all read from one traversal instead of walking the tree themselves.
+    Excluded directories are pruned by the walker and never entered.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = root
+        self.top_level: List[str] = []
+        self.files: List[str] = []
+        self.dirs: List[str] = []
+        self.visited_dirs = 0
+        self.pruned_dirs = 0
+        self.by_extension: Dict[str, List[str]] = {}
+        self.by_name: Dict[str, List[str]] = {}
+    
+    @classmethod
+    def scan(cls, root: Path, walker: Optional[WorkspaceWalker] = None) -> "RepoInventory":
+        """Walk root once, without following symlinked directories.
+        
+        The walk runs on a copy of walker, so repositories scanned at the
+        same time keep their directory counts apart.
+        """
+        inventory = cls(root)
+        walker = walker.copy() if walker is not None else WorkspaceWalker()
+        root_dir = str(root)
+        for entry, is_dir in walker.iter_entries(root_dir):
+            if os.path.dirname(entry.path) == root_dir:
+                inventory.top_level.append(entry.path)
+            if is_dir:
+                inventory.dirs.append(entry.path)
+                continue
+            
+            name = entry.name
+            inventory.files.append(entry.path)
+            inventory.by_name.setdefault(name, []).append(entry.path)
+            _, dot, extension = name.rpartition(".")
+            if dot:
+                inventory.by_extension.setdefault(f".{extension}", []).append(entry.path)
+        inventory.visited_dirs = walker.visited
+        inventory.pruned_dirs = walker.pruned
+        return inventory
+    
+    def with_extension(self, *extensions: str) -> List[str]:
+        """Files whose name ends in one of the given extensions (e.g. ".py")."""
+        return [path for extension in extensions for path in self.by_extension.get(extension, [])]
+    
+    def has_extension(self, extension: str) -> bool:
+        """Whether any file ends in the given extension."""
+        return bool(self.by_extension.get(extension))
+    
+    def top_level_matching(self, prefix: str) -> List[str]:
+        """Top-level entries whose name starts with prefix, in listing order."""
+        return [path for path in self.top_level if os.path.basename(path).startswith(prefix)]
+    
+    def any_path_contains(self, fragment: str) -> bool:
+        """Whether the repository-relative path of any file or directory contains fragment."""
+        start = len(str(self.root)) + 1
+        return any(fragment in path[start:].replace(os.sep, "/")
+                   for paths in (self.dirs, self.files) for path in paths)
+
 @dataclass
 class DocumentationStats:
     """Documentation statistics for a repository."""
@@ -46,12 +297,27 @@ class DocumentationStats:
     readme_score: int
     api_docs_present: bool
     last_updated: str
+    wall_seconds: float = 0.0
+    queue_seconds: float = 0.0
 
 class RiggerDocumentationAnalyzer:
     """Analyzes and enhances documentation across Rigger repositories."""
     
-    def __init__(self, base_path: str = "/Users/tiaastor/Github/tiation-repos"):
+    def __init__(self, base_path: str = "/Users/tiaastor/Github/tiation-repos",
+                 exclude_dirs: Optional[List[str]] = None,
+                 exclude_file: Optional[str] = DEFAULT_EXCLUDE_FILE,
+                 use_gitignore: bool = True,
+                 workers: int = 1,
+                 repo_jobs: int = 1,
+                 cache_path: Optional[str] = None,
+                 use_cache: bool = True,
+                 cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
         self.base_path = Path(base_path)
+        self.reports_dir = self.base_path / "docs" / "reports"
+        self.workers = max(workers, 1)
+        self.repo_jobs = max(repo_jobs, 1)
+        self._pool = None
+        self._pool_lock = threading.Lock()
         self.repos = [
             "RiggerBackend",
             "RiggerShared", 
@@ -67,78 +333,112 @@ class RiggerDocumentationAnalyzer:
             "gitlab": "145.223.22.10",
             "helm": "145.223.21.248"
         }
+        self.exclude_dirs = DEFAULT_EXCLUDE_DIRS + list(exclude_dirs or [])
+        # Exclusions match whole directory names, so rebuild_utils.ts is not caught by "build"
+        self.walker = WorkspaceWalker(exclude_file=exclude_file,
+                                      excludes=[f"{name}/" for name in self.exclude_dirs],
+                                      use_gitignore=use_gitignore)
+        self.cache = None
+        if use_cache:
+            db_path = Path(cache_path) if cache_path else self.reports_dir / ".cache" / "coverage.sqlite"
+            try:
+                self.cache = CoverageCache(db_path, max_entries=cache_max_entries)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Coverage cache unavailable at {db_path}, analyzing without it: {e}")
     
-    def analyze_python_files(self, repo_path: Path) -> Tuple[int, int, int, int]:
+    def analyze_python_files(self, repo_path: Path,
+                             inventory: Optional[RepoInventory] = None) -> Tuple[int, int, int, int]:
         """Analyze Python files for documentation coverage."""
-        total_functions = 0
-        documented_functions = 0
-        total_classes = 0
-        documented_classes = 0
+        inventory = inventory or RepoInventory.scan(repo_path, self.walker)
+        py_files = inventory.with_extension(".py")
+        totals = [0, 0, 0, 0]
         
-        for py_file in repo_path.rglob("*.py"):
-            if "venv" in str(py_file) or "__pycache__" in str(py_file):
+        for py_file, (counts, error) in zip(py_files, self._cached_counts("python", py_files, self._python_counts)):
+            if error is not None:
+                logger.warning(f"Error analyzing {py_file}: {error}")
                 continue
+            for i, count in enumerate(counts):
+                totals[i] += count
                 
+        return tuple(totals)
+    
+    def _python_counts(self, py_files: List[str]) -> List[Tuple[Optional[Tuple[int, int, int, int]], Optional[str]]]:
+        """Per-file counts, parsed on the process pool when there are enough files to pay for it."""
+        if self.workers > 1 and len(py_files) >= PARALLEL_MIN_FILES:
+            chunk_size = max(1, min(MAX_CHUNK_FILES, len(py_files) // (self.workers * 4)))
+            chunks = [py_files[i:i + chunk_size] for i in range(0, len(py_files), chunk_size)]
             try:
-                with open(py_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    tree = ast.parse(content)
-                    
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.FunctionDef):
-                        total_functions += 1
-                        if ast.get_docstring(node):
-                            documented_functions += 1
-                    elif isinstance(node, ast.ClassDef):
-                        total_classes += 1
-                        if ast.get_docstring(node):
-                            documented_classes += 1
-                            
-            except Exception as e:
-                logger.warning(f"Error analyzing {py_file}: {e}")
-                
-        return total_functions, documented_functions, total_classes, documented_classes
+                with self._pool_lock:
+                    if self._pool is None:
+                        self._pool = ProcessPoolExecutor(
+                            max_workers=self.workers, mp_context=multiprocessing.get_context(_POOL_START_METHOD))
+                    pool = self._pool
+                return [result for chunk in pool.map(python_chunk_counts, chunks) for result in chunk]
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Process pool unavailable, analyzing serially: {e}")
+                self._shutdown_pool()
+        with _PARSE_LOCK:
+            return python_chunk_counts(py_files)
+    
+    def _cached_counts(self, kind: str, files: List[str], compute) -> List[Tuple[Optional[Tuple[int, ...]], Optional[str]]]:
+        """Per-file (counts, error), computing only the files whose content the cache has not seen."""
+        if self.cache is None:
+            return compute(files)
+        
+        digests = {}
+        for path in files:
+            try:
+                digests[path] = file_digest(path)
+            except OSError:
+                # Unreadable files are left to compute, which reports the error
+                pass
+        cached = self.cache.lookup(kind, list(digests.values()))
+        misses = [path for path in files if digests.get(path) not in cached]
+        fresh = dict(zip(misses, compute(misses)))
+        self.cache.store(kind, {digests[path]: fresh[path] for path in misses if path in digests})
+        return [fresh[path] if path in fresh else cached[digests[path]] for path in files]
+    
+    def _shutdown_pool(self):
+        """Shut down the worker processes, if any were started."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+    
+    def close(self):
+        """Shut down the worker processes and write out the coverage cache."""
+        self._shutdown_pool()
+        if self.cache is not None:
+            try:
+                self.cache.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not write coverage cache {self.cache.db_path}: {e}")
+            self.cache = None
     
-    def analyze_javascript_files(self, repo_path: Path) -> Tuple[int, int]:
+    def analyze_javascript_files(self, repo_path: Path,
+                                 inventory: Optional[RepoInventory] = None) -> Tuple[int, int]:
         """Analyze JavaScript/TypeScript files for documentation coverage."""
+        inventory = inventory or RepoInventory.scan(repo_path, self.walker)
         total_functions = 0
         documented_functions = 0
         
-        patterns = ["*.js", "*.ts", "*.jsx", "*.tsx"]
-        for pattern in patterns:
-            for js_file in repo_path.rglob(pattern):
-                if "node_modules" in str(js_file) or "build" in str(js_file):
-                    continue
-                    
-                try:
-                    with open(js_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        
-                    # Simple regex patterns for function detection
-                    function_patterns = [
-                        r'function\s+\w+\s*\(',
-                        r'const\s+\w+\s*=\s*\(',
-                        r'export\s+function\s+\w+\s*\(',
-                        r'\w+\s*:\s*function\s*\(',
-                        r'\w+\s*:\s*\([^)]*\)\s*=>'
-                    ]
-                    
-                    for pattern in function_patterns:
-                        matches = re.findall(pattern, content)
-                        total_functions += len(matches)
-                        
-                    # Check for JSDoc comments
-                    jsdoc_pattern = r'/\*\*[\s\S]*?\*/'
-                    documented_functions += len(re.findall(jsdoc_pattern, content))
-                    
-                except Exception as e:
-                    logger.warning(f"Error analyzing {js_file}: {e}")
+        js_files = inventory.with_extension(".js", ".ts", ".jsx", ".tsx")
+        for js_file, (counts, error) in zip(js_files,
+                                            self._cached_counts("javascript", js_files, javascript_chunk_counts)):
+            if error is not None:
+                logger.warning(f"Error analyzing {js_file}: {error}")
+                continue
+            total_functions += counts[0]
+            documented_functions += counts[1]
                     
         return total_functions, min(documented_functions, total_functions)
     
-    def analyze_readme_quality(self, repo_path: Path) -> int:
+    def analyze_readme_quality(self, repo_path: Path, inventory: Optional[RepoInventory] = None) -> int:
         """Analyze README quality and completeness."""
-        readme_files = list(repo_path.glob("README*"))
+        if inventory is not None:
+            readme_files = inventory.top_level_matching("README")
+        else:
+            readme_files = list(repo_path.glob("README*"))
         if not readme_files:
             return 0
             
@@ -170,15 +470,16 @@ class RiggerDocumentationAnalyzer:
             logger.warning(f"Error analyzing README in {repo_path}: {e}")
             return 0
     
-    def check_api_documentation(self, repo_path: Path) -> bool:
+    def check_api_documentation(self, repo_path: Path, inventory: Optional[RepoInventory] = None) -> bool:
         """Check if API documentation exists."""
+        inventory = inventory or RepoInventory.scan(repo_path, self.walker)
         api_indicators = [
             "docs/api", "api.md", "swagger", "openapi", 
             "postman", "api-reference"
         ]
         
         for indicator in api_indicators:
-            if list(repo_path.rglob(f"*{indicator}*")):
+            if inventory.any_path_contains(indicator):
                 return True
         return False
     
@@ -191,6 +492,9 @@ class RiggerDocumentationAnalyzer:
             return None
             
         logger.info(f"Analyzing repository: {repo_name}")
+        inventory = RepoInventory.scan(repo_path, self.walker)
+        logger.debug(f"{repo_name}: {len(inventory.files)} files, {inventory.visited_dirs} directories visited, "
+                     f"{inventory.pruned_dirs} pruned")
         
         # Determine repository type and analyze accordingly
         total_functions = 0
@@ -198,16 +502,16 @@ class RiggerDocumentationAnalyzer:
         total_classes = 0
         documented_classes = 0
         
-        if any(repo_path.rglob("*.py")):
+        if inventory.has_extension(".py"):
             # Python repository
             total_functions, documented_functions, total_classes, documented_classes = \
-                self.analyze_python_files(repo_path)
-        elif any(repo_path.rglob("*.js")) or any(repo_path.rglob("*.ts")):
+                self.analyze_python_files(repo_path, inventory)
+        elif inventory.has_extension(".js") or inventory.has_extension(".ts"):
             # JavaScript/TypeScript repository
-            total_functions, documented_functions = self.analyze_javascript_files(repo_path)
+            total_functions, documented_functions = self.analyze_javascript_files(repo_path, inventory)
         
-        readme_score = self.analyze_readme_quality(repo_path)
-        api_docs_present = self.check_api_documentation(repo_path)
+        readme_score = self.analyze_readme_quality(repo_path, inventory)
+        api_docs_present = self.check_api_documentation(repo_path, inventory)
         
         return DocumentationStats(
             repo_name=repo_name,
@@ -250,7 +554,11 @@ class RiggerDocumentationAnalyzer:
                     "readme_score": stats.readme_score,
                     "api_documentation": stats.api_docs_present,
                     "overall_score": self.calculate_overall_score(stats),
-                    "last_updated": stats.last_updated
+                    "last_updated": stats.last_updated,
+                    "timing": {
+                        "wall_seconds": round(stats.wall_seconds, 3),
+                        "queue_seconds": round(stats.queue_seconds, 3)
+                    }
                 }
                 
                 report["repositories"].append(repo_data)
@@ -367,21 +675,66 @@ class RiggerDocumentationAnalyzer:
             logger.info(f"Would create issue for {stats.repo_name}: {issue_title}")
             # In production, this would use GitHub API to create actual issues
     
+    def load_previous_durations(self) -> Dict[str, float]:
+        """Per-repository wall time from the most recent saved report, if any."""
+        reports = sorted(self.reports_dir.glob("documentation_report_*.json"))
+        if not reports:
+            return {}
+        try:
+            with open(reports[-1], 'r') as f:
+                previous = json.load(f)
+            return {repo["name"]: repo["timing"]["wall_seconds"]
+                    for repo in previous.get("repositories", []) if "timing" in repo}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Could not read previous durations from {reports[-1]}: {e}")
+            return {}
+    
+    def analyze_repositories(self, repo_names: List[str]) -> List[DocumentationStats]:
+        """Analyze repositories concurrently, returning stats in repo_names order.
+        
+        Repositories are started longest first according to the previous
+        run's durations, with unknown ones first of all, which keeps the
+        slowest repository from starting last. Each result records its
+        wall time and how long it waited for a free slot.
+        """
+        durations = self.load_previous_durations()
+        schedule = sorted(repo_names, key=lambda name: -durations.get(name, float("inf")))
+        submitted = time.perf_counter()
+        
+        def run(repo_name: str) -> Optional[DocumentationStats]:
+            started = time.perf_counter()
+            stats = self.analyze_repository(repo_name)
+            if stats:
+                stats.queue_seconds = started - submitted
+                stats.wall_seconds = time.perf_counter() - started
+            return stats
+        
+        with ThreadPoolExecutor(max_workers=self.repo_jobs, thread_name_prefix="repo") as executor:
+            futures = {repo_name: executor.submit(run, repo_name) for repo_name in schedule}
+            results = {repo_name: future.result() for repo_name, future in futures.items()}
+        
+        return [results[repo_name] for repo_name in repo_names if results[repo_name]]
+    
     def run_analysis(self, create_issues: bool = False, send_metrics: bool = False):
         """Run complete documentation analysis."""
         logger.info("Starting documentation analysis for Rigger ecosystem")
         
-        stats_list = []
-        for repo_name in self.repos:
-            stats = self.analyze_repository(repo_name)
-            if stats:
-                stats_list.append(stats)
+        start = time.perf_counter()
+        stats_list = self.analyze_repositories(self.repos)
+        wall_time = time.perf_counter() - start
         
         # Generate comprehensive report
         report = self.generate_documentation_report(stats_list)
+        report["analysis_wall_seconds"] = round(wall_time, 3)
+        if self.cache is not None:
+            report["coverage_cache"] = {
+                "hits": self.cache.hits,
+                "misses": self.cache.misses,
+                "hit_rate": round(self.cache.hit_rate, 1)
+            }
         
         # Save report to file
-        report_path = self.base_path / "docs" / "reports" / f"documentation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        report_path = self.reports_dir / f"documentation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         report_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(report_path, 'w') as f:
@@ -396,6 +749,13 @@ class RiggerDocumentationAnalyzer:
         print(f"Overall Documentation Coverage: {report['ecosystem_metrics']['overall_documentation_coverage']:.1f}%")
         print(f"Repositories with API Docs: {report['ecosystem_metrics']['repositories_with_api_docs']}")
         print(f"Average README Score: {report['ecosystem_metrics']['average_readme_score']:.1f}/100")
+        print(f"Analysis Wall Time: {report['analysis_wall_seconds']:.2f}s")
+        if "coverage_cache" in report:
+            cache = report["coverage_cache"]
+            print(f"Coverage Cache: {cache['hit_rate']:.1f}% hit rate "
+                  f"({cache['hits']} hits / {cache['misses']} misses)")
+        else:
+            print("Coverage Cache: disabled")
         
         print(f"\n📋 Repository Details:")
         for repo_data in report["repositories"]:
@@ -404,6 +764,8 @@ class RiggerDocumentationAnalyzer:
             print(f"  Function Coverage: {repo_data['documentation_coverage']['functions']['percentage']:.1f}%")
             print(f"  README Score: {repo_data['readme_score']}/100")
             print(f"  API Docs: {'✅' if repo_data['api_documentation'] else '❌'}")
+            print(f"  Analysis Time: {repo_data['timing']['wall_seconds']:.2f}s "
+                  f"(queued {repo_data['timing']['queue_seconds']:.2f}s)")
         
         # Optional integrations
         if send_metrics:
@@ -425,13 +787,35 @@ def main():
                        help="Send metrics to Grafana dashboard")
     parser.add_argument("--verbose", "-v", action="store_true",
                        help="Enable verbose logging")
+    parser.add_argument("--exclude-dir", action="append", default=[],
+                       help="Directory name to skip in addition to the defaults (repeatable)")
+    parser.add_argument("--exclude-file", default=DEFAULT_EXCLUDE_FILE,
+                       help="Global exclude patterns in gitignore syntax (default: .walkignore)")
+    parser.add_argument("--no-gitignore", action="store_true",
+                       help="Do not skip paths listed in each repository's .gitignore")
+    parser.add_argument("--repo-jobs", type=int, default=4,
+                       help="Repositories analyzed concurrently")
+    parser.add_argument("--workers", type=int, default=1,
+                       help=f"Processes used to parse Python files (repositories with fewer than "
+                            f"{PARALLEL_MIN_FILES} files are always parsed serially)")
+    parser.add_argument("--cache-path", default=None,
+                       help="Coverage cache database (default: <base-path>/docs/reports/.cache/coverage.sqlite)")
+    parser.add_argument("--no-cache", action="store_true",
+                       help="Parse every file instead of reusing cached per-file counts")
+    parser.add_argument("--cache-max-entries", type=int, default=DEFAULT_CACHE_MAX_ENTRIES,
+                       help=f"Per-file results kept in the coverage cache (default: {DEFAULT_CACHE_MAX_ENTRIES})")
     
     args = parser.parse_args()
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    analyzer = RiggerDocumentationAnalyzer(args.base_path)
+    analyzer = RiggerDocumentationAnalyzer(args.base_path, exclude_dirs=args.exclude_dir,
+                                           exclude_file=args.exclude_file,
+                                           use_gitignore=not args.no_gitignore,
+                                           workers=args.workers, repo_jobs=args.repo_jobs,
+                                           cache_path=args.cache_path, use_cache=not args.no_cache,
+                                           cache_max_entries=args.cache_max_entries)
     
     try:
         report = analyzer.run_analysis(
@@ -445,6 +829,9 @@ def main():
     except Exception as e:
         logger.error(f"Documentation analysis failed: {e}")
         return 1
+    
+    finally:
+        analyzer.close()
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -6,161 +6,2387 @@ Validates footer consistency across all README files
 
 import os
 import re
+import sys
 import json
+import mmap
+import time
+import ctypes
+import ctypes.util
+import select
+import struct
+import sqlite3
+from array import array
+from collections import deque
+import difflib
+import hashlib
+import heapq
+import argparse
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional, Iterator, Union
 
-def find_readme_files(base_path: str) -> List[str]:
-    """Find all README.md files in the repository"""
+from workspace_walker import DEFAULT_EXCLUDE_FILE, WorkspaceWalker
+
+DEFAULT_BASE_PATH = "/Users/tiaastor/Github/tiation-repos"
+REPORT_FILENAME = "footer_validation_report.md"
+DATA_FILENAME = "footer_validation_data.json"
+NDJSON_FILENAME = "footer_validation_data.ndjson"
+BINARY_FILENAME = "footer_validation_data.bin"
+HISTORY_FILENAME = "footer_validation_history.sqlite"
+CACHE_FILENAME = "footer_validation_cache.sqlite"
+FIX_DIFF_FILENAME = "footer_fix.diff"
+MANIFEST_FILENAME = "footer_validation_manifest.json"
+
+# Bump whenever analyze_footer changes what it reports so cached results are dropped
+ANALYZER_VERSION = "3"
+CACHE_SCHEMA_VERSION = 2
+# READMEs looked up in the cache ahead of the one being yielded, and cache
+# rows queued before they are written out
+LOOKUP_WINDOW = 256
+CACHE_FLUSH_ROWS = 1000
+
+# Tail-only mode: footer checks look at the last TAIL_WINDOW_BYTES, whole-file
+# flags are found by scanning the mapped file SCAN_CHUNK_BYTES at a time
+TAIL_WINDOW_BYTES = 4096
+SCAN_CHUNK_BYTES = 1 << 20
+FOOTER_PREVIEW_CHARS = 500
+UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+# UTF-8 encodings of every character a str regex matches with \s (all of them lie below U+3001),
+# so line patterns give the same answer on bytes as on decoded text
+UTF8_WHITESPACE = b"(?:" + b"|".join(re.escape(chr(c).encode("utf-8"))
+                                     for c in range(0x3001) if chr(c).isspace()) + b")"
+
+WHOLE_FILE_FLAGS = ("has_tiation_link", "has_enterprise_mention", "has_ngo_mention")
+FOOTER_FLAGS = ("has_footer_section", "has_centered_footer", "has_built_with")
+# Every boolean in an analyze_footer result, in result key order
+RESULT_FLAGS = ("has_tiation_link", "has_enterprise_mention", "has_ngo_mention", "has_footer_section",
+                "has_centered_footer", "has_built_with", "ends_with_footer")
+
+class FooterMatcher:
+    """Compiled matcher computing all footer flags in one sweep
+
+    The flag rules (the built-in footer flags unless other tables are
+    given) are compiled once into three groups: case-sensitive
+    literals searched in the original buffer, case-insensitive literals
+    searched in a single shared lowercased copy (made only if such a flag
+    is requested), and line patterns compiled to one regex each. Every
+    flag stops at its first hit. Works on both str and bytes buffers; for
+    bytes, \s in a line pattern (outside character classes) also matches
+    UTF-8 encoded Unicode whitespace, as it does on str.
+    """
+    
+    CASE_SENSITIVE = {
+        "has_tiation_link": ["tiation.github.io"],
+        "has_centered_footer": ['align="center"'],
+    }
+    CASE_INSENSITIVE = {
+        "has_enterprise_mention": ["enterprise"],
+        "has_ngo_mention": ["chasewhiterabbit", "ngo", "chase white rabbit"],
+        "has_built_with": ["built with", "powered by"],
+    }
+    LINE_PATTERNS = {
+        "has_footer_section": r"---\s*$",
+    }
+    
+    def __init__(self, case_sensitive: Optional[Dict[str, List[str]]] = None,
+                 case_insensitive: Optional[Dict[str, List[str]]] = None,
+                 line_patterns: Optional[Dict[str, str]] = None):
+        self.case_sensitive = self.CASE_SENSITIVE if case_sensitive is None else case_sensitive
+        self.case_insensitive = self.CASE_INSENSITIVE if case_insensitive is None else case_insensitive
+        self.line_patterns = self.LINE_PATTERNS if line_patterns is None else line_patterns
+        self.flags = tuple(list(self.case_sensitive) + list(self.case_insensitive) + list(self.line_patterns))
+        literals = [m for table in (self.case_sensitive, self.case_insensitive)
+                    for markers in table.values() for m in markers]
+        self.max_literal_length = max((len(m.encode("utf-8")) for m in literals), default=1)
+        self._compiled = {False: self._compile(str)}
+    
+    def _compile(self, kind) -> Tuple[List, List, List]:
+        """Build the search plan for str or bytes buffers"""
+        convert = (lambda m: m.encode("utf-8")) if kind is bytes else (lambda m: m)
+        sensitive = [(flag, [convert(m) for m in markers]) for flag, markers in self.case_sensitive.items()]
+        insensitive = [(flag, [convert(m.lower()) for m in markers]) for flag, markers in self.case_insensitive.items()]
+        if kind is bytes:
+            # An even run of backslashes before s leaves \s alone
+            convert = lambda p: re.sub(rb"(?<!\\)((?:\\\\)*)\\s", lambda m: m.group(1) + UTF8_WHITESPACE,
+                                       p.encode("utf-8"))
+        lines = [(flag, re.compile(convert(pattern), re.MULTILINE)) for flag, pattern in self.line_patterns.items()]
+        return sensitive, insensitive, lines
+    
+    def scan(self, text, flags=None) -> Dict[str, bool]:
+        """Compute the requested flags (default: all) for a str or bytes buffer"""
+        wanted = self.flags if flags is None else flags
+        binary = not isinstance(text, str)
+        if binary not in self._compiled:
+            self._compiled[binary] = self._compile(bytes)
+        sensitive, insensitive, lines = self._compiled[binary]
+        found = {}
+        
+        for flag, markers in sensitive:
+            if flag in wanted:
+                found[flag] = any(m in text for m in markers)
+        
+        lowered = None
+        for flag, markers in insensitive:
+            if flag in wanted:
+                if lowered is None:
+                    lowered = text.lower()
+                found[flag] = any(m in lowered for m in markers)
+        
+        for flag, pattern in lines:
+            if flag in wanted:
+                found[flag] = pattern.search(text) is not None
+        
+        return found
+
+FOOTER_MATCHER = FooterMatcher()
+
+class FooterRuleSet:
+    """Declarative footer rules compiled into one matcher per scope
+
+    A JSON rule file holds a "rules" list. Each rule has a unique "id", a "type"
+    ("required" or "forbidden", default required), either "literal" or
+    "regex" (a string or a list of alternatives; regexes match per line),
+    an optional "ignore_case" flag and a "scope":
+
+    - "file": the whole README (default)
+    - "tail:N": the last N characters (N >= 1)
+    - "last_section": everything after the last heading or --- rule
+
+    All rules sharing a scope are compiled into a single FooterMatcher, so
+    each scope is swept once per file however many rules it holds.
+    Compiled rule sets are cached per rule file and reused until the file
+    changes.
+    """
+    
+    _loaded = {}
+    
+    def __init__(self, rules: List[Dict], fingerprint: str = ""):
+        if not isinstance(rules, list):
+            raise ValueError(f"Footer rules must be a list, not {type(rules).__name__}")
+        self.rules = []
+        tables = {}
+        for rule in rules:
+            if not isinstance(rule, dict):
+                raise ValueError(f"Footer rule must be an object: {rule!r}")
+            rule_id = rule.get("id")
+            if not rule_id or not isinstance(rule_id, str):
+                raise ValueError(f"Footer rule without an id: {rule}")
+            if any(rule_id == seen for seen, _, _ in self.rules):
+                raise ValueError(f"Duplicate footer rule id {rule_id!r}")
+            rule_type = rule.get("type", "required")
+            if rule_type not in ("required", "forbidden"):
+                raise ValueError(f"Footer rule {rule_id}: unknown type {rule_type!r}")
+            scope = rule.get("scope", "file")
+            if not isinstance(scope, str):
+                raise ValueError(f"Footer rule {rule_id}: scope must be a string, not {type(scope).__name__}")
+            if scope not in ("file", "last_section") and not re.fullmatch(r"tail:\d+", scope):
+                raise ValueError(f"Footer rule {rule_id}: unknown scope {scope!r}")
+            if scope.startswith("tail:") and int(scope[5:]) == 0:
+                # content[-0:] would be the whole file
+                raise ValueError(f"Footer rule {rule_id}: scope {scope!r} must cover at least one character")
+            
+            case_sensitive, case_insensitive, line_patterns = tables.setdefault(scope, ({}, {}, {}))
+            if "literal" in rule:
+                literals = self._strings(rule_id, "literal", rule["literal"])
+                (case_insensitive if rule.get("ignore_case") else case_sensitive)[rule_id] = literals
+            elif "regex" in rule:
+                regexes = self._strings(rule_id, "regex", rule["regex"])
+                pattern = "|".join(f"(?:{regex})" for regex in regexes)
+                try:
+                    re.compile(pattern)
+                except re.error as e:
+                    raise ValueError(f"Footer rule {rule_id}: invalid regex: {e}")
+                line_patterns[rule_id] = f"(?i:{pattern})" if rule.get("ignore_case") else pattern
+            else:
+                raise ValueError(f"Footer rule {rule_id}: needs a literal or a regex")
+            self.rules.append((rule_id, rule_type == "required", scope))
+        
+        self.matchers = {scope: FooterMatcher(*table) for scope, table in tables.items()}
+        self.fingerprint = fingerprint
+    
+    @staticmethod
+    def _strings(rule_id: str, field: str, value) -> List[str]:
+        """A rule field given as a string or a non-empty list of strings, as a list"""
+        if isinstance(value, str):
+            return [value]
+        if isinstance(value, list) and value and all(isinstance(item, str) for item in value):
+            return value
+        raise ValueError(f"Footer rule {rule_id}: {field} must be a string or a non-empty list of strings")
+    
+    @classmethod
+    def load(cls, path: str) -> "FooterRuleSet":
+        """Load and compile a rule file, reusing the compiled set while the file is unchanged"""
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        ruleset = cls._loaded.get(key)
+        if ruleset is None:
+            with open(path, "rb") as f:
+                raw = f.read()
+            try:
+                rules = json.loads(raw)["rules"]
+            except (ValueError, KeyError, TypeError) as e:
+                raise ValueError(f"Invalid footer rule file {path}: {e}")
+            ruleset = cls(rules, hashlib.blake2b(raw, digest_size=8).hexdigest())
+            cls._loaded[key] = ruleset
+        return ruleset
+    
+    @staticmethod
+    def _scoped(content: str, scope: str) -> str:
+        """The part of the content a scope refers to"""
+        if scope == "file":
+            return content
+        if scope == "last_section":
+            start = max(content.rfind("\n#"), content.rfind("\n---"))
+            return content[start + 1:] if start >= 0 else content
+        return content[-int(scope[5:]):]
+    
+    def evaluate(self, content: str) -> List[str]:
+        """Ids of the rules the content violates, in rule file order"""
+        found = {}
+        for scope, matcher in self.matchers.items():
+            found.update(matcher.scan(self._scoped(content, scope)))
+        return [rule_id for rule_id, required, _ in self.rules if found[rule_id] != required]
+
+def find_readme_files(base_path: str, walker: Optional[WorkspaceWalker] = None) -> List[str]:
+    """Find all README.md files in the repository
+
+    Directories excluded by the walker's global exclude file or by a
+    .gitignore are pruned before they are entered.
+    """
+    walker = walker or WorkspaceWalker()
+    return list(walker.iter_files(base_path, lambda name: name.lower() == 'readme.md'))
+
+def _git_tracked_readmes(repo_path: str) -> Optional[List[str]]:
+    """List README.md files in a repository's git index as /-separated relative paths, or None if git fails"""
+    try:
+        output = subprocess.run(
+            ["git", "-C", repo_path, "ls-files", "-z", "--cached", "--recurse-submodules"],
+            capture_output=True, check=True, timeout=60).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
     readme_files = []
-    for root, dirs, files in os.walk(base_path):
-        # Skip node_modules and .git directories
-        dirs[:] = [d for d in dirs if d not in ['node_modules', '.git', '.archive']]
+    for entry in output.split(b"\0"):
+        if not entry:
+            continue
+        rel_path = os.fsdecode(entry)
+        # The index can still list files deleted from the working tree
+        if (rel_path.rpartition("/")[2].lower() == 'readme.md'
+                and os.path.isfile(os.path.join(repo_path, *rel_path.split("/")))):
+            readme_files.append(rel_path)
+    return readme_files
+
+def find_readme_files_git(base_path: str, walker: Optional[WorkspaceWalker] = None) -> List[str]:
+    """Find README.md files using each repository's git index
+
+    Directories are walked with os.scandir until a repository root is
+    reached; from there the tracked files come from git ls-files instead of
+    walking the checkout. Untracked READMEs inside a repository are not
+    reported. Directories outside any repository, or where git is not
+    available, are walked normally. Both are filtered through the walker's
+    exclude file and .gitignore rules, like find_readme_files.
+    """
+    walker = walker or WorkspaceWalker()
+    readme_files = []
+    stack = [(base_path, "")]
+    while stack:
+        current, rel_dir = stack.pop()
+        if os.path.exists(os.path.join(current, '.git')):
+            tracked = _git_tracked_readmes(current)
+            if tracked is not None:
+                for rel_path in tracked:
+                    rel_path = f"{rel_dir}/{rel_path}" if rel_dir else rel_path
+                    if not walker.is_excluded(base_path, rel_path):
+                        readme_files.append(os.path.join(base_path, *rel_path.split("/")))
+                continue
+        
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
         
-        for file in files:
-            if file.lower() == 'readme.md':
-                readme_files.append(os.path.join(root, file))
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if not walker.is_excluded(base_path, rel_path, True):
+                    subdirs.append((entry.path, rel_path))
+            elif entry.name.lower() == 'readme.md' and not walker.is_excluded(base_path, rel_path):
+                readme_files.append(entry.path)
+        # Visit subdirectories in listing order, like os.walk
+        stack.extend(reversed(subdirs))
     
     return readme_files
 
-def analyze_footer(file_path: str) -> Dict:
+def changed_readme_files(base_path: str, since: str,
+                         walker: Optional[WorkspaceWalker] = None) -> Tuple[List[str], List[str]]:
+    """List README.md files changed since a git ref
+
+    Returns (changed, removed): absolute paths of READMEs that were added or
+    modified between the ref and the working tree, and paths relative to
+    base_path of READMEs that were deleted. Paths the walker excludes are
+    skipped. Raises CalledProcessError if base_path is not a git checkout
+    or the ref is unknown.
+    """
+    walker = walker or WorkspaceWalker()
+    output = subprocess.run(
+        ["git", "-C", base_path, "diff", "--name-status", "-z", "--no-renames", "--relative", since, "--"],
+        capture_output=True, check=True, timeout=60).stdout
+    fields = [os.fsdecode(field) for field in output.split(b"\0") if field]
+    
+    changed, removed = [], []
+    for status, rel_path in zip(fields[0::2], fields[1::2]):
+        parts = rel_path.split("/")
+        if parts[-1].lower() != 'readme.md' or walker.is_excluded(base_path, rel_path):
+            continue
+        file_path = os.path.join(base_path, *parts)
+        if status == "D" or not os.path.isfile(file_path):
+            removed.append(os.path.relpath(file_path, base_path))
+        else:
+            changed.append(file_path)
+    return changed, removed
+
+def discover_readme_files(base_path: str, discovery: str = "walk",
+                          walker: Optional[WorkspaceWalker] = None) -> List[str]:
+    """Run a discovery backend, using walker's exclusions if given
+
+    Paths are returned sorted: directory listing order differs between
+    filesystems and hosts, and shards must agree on one order.
+    """
+    return sorted(DISCOVERY_BACKENDS[discovery](base_path, walker))
+
+def merge_results(existing: Dict, updates: Dict, removed: List[str]) -> Dict:
+    """Merge fresh results into a previous run, keeping its ordering
+
+    Updated paths keep their position, new paths are appended and removed
+    paths are dropped.
+    """
+    merged = {path: updates.get(path, data) for path, data in existing.items() if path not in removed}
+    for path, data in updates.items():
+        if path not in merged:
+            merged[path] = data
+    return merged
+
+DISCOVERY_BACKENDS = {
+    "walk": find_readme_files,
+    "git": find_readme_files_git,
+}
+
+def read_readme(file_path: str) -> str:
+    """Read a README file as text"""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def content_hash(raw: bytes) -> str:
+    """Hash raw README bytes for cache validation"""
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+def read_readme_bytes(file_path: str) -> bytes:
+    """Read a README file as raw bytes"""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+def analyze_footer(file_path: str, rules: Optional[FooterRuleSet] = None) -> Dict:
     """Analyze the footer section of a README file"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        raw = read_readme_bytes(file_path)
     except Exception as e:
         return {"error": f"Could not read file: {e}"}
     
+    return analyze_footer_bytes(raw, rules)
+
+def analyze_footer_bytes(raw: bytes, rules: Optional[FooterRuleSet] = None) -> Dict:
+    """Analyze raw README bytes without decoding the whole file
+
+    The ASCII markers are searched in the buffer itself and only the tail
+    needed for the preview is decoded, with errors='replace', so stray
+    non-UTF-8 bytes no longer turn the file into an error entry. For valid
+    UTF-8 the result equals analyze_footer_content on the decoded text.
+    """
+    if b"\r" in raw:
+        # Universal newlines, as in text mode
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    flags = FOOTER_MATCHER.scan(raw)
+    tail = _decode_tail(raw[-FOOTER_PREVIEW_CHARS * 4:])
+    if not tail.rstrip() and len(raw) > FOOTER_PREVIEW_CHARS * 4:
+        tail = raw.decode('utf-8', 'replace')
+    footer_analysis = {
+        "has_tiation_link": flags["has_tiation_link"],
+        "has_enterprise_mention": flags["has_enterprise_mention"],
+        "has_ngo_mention": flags["has_ngo_mention"],
+        "has_footer_section": flags["has_footer_section"],
+        "has_centered_footer": flags["has_centered_footer"],
+        "has_built_with": flags["has_built_with"],
+        "content_length": len(raw.translate(None, UTF8_CONTINUATION_BYTES)),
+        "ends_with_footer": _ends_with_footer(tail),
+    }
+    footer_analysis["footer_preview"] = tail[-FOOTER_PREVIEW_CHARS:].replace('\n', '\\n')
+    
+    if rules is not None:
+        footer_analysis["rule_failures"] = rules.evaluate(raw.decode('utf-8', 'replace'))
+    
+    return footer_analysis
+
+def _decode_tail(raw_tail: bytes) -> str:
+    """Decode a byte tail starting on a character boundary, replacing invalid bytes"""
+    start = 0
+    while start < min(len(raw_tail), 3) and raw_tail[start] in UTF8_CONTINUATION_BYTES:
+        start += 1
+    return raw_tail[start:].decode('utf-8', 'replace')
+
+def analyze_footer_content(content: str, rules: Optional[FooterRuleSet] = None) -> Dict:
+    """Analyze the footer section of already loaded README content
+
+    With a FooterRuleSet the ids of the violated rules are added under
+    "rule_failures".
+    """
     # Look for footer patterns
+    flags = FOOTER_MATCHER.scan(content)
     footer_analysis = {
-        "has_tiation_link": "tiation.github.io" in content,
-        "has_enterprise_mention": any(word in content.lower() for word in ["enterprise", "enterprise-grade"]),
-        "has_ngo_mention": any(phrase in content.lower() for phrase in ["chasewhiterabbit", "ngo", "chase white rabbit"]),
-        "has_footer_section": bool(re.search(r'---\s*$', content, re.MULTILINE)),
-        "has_centered_footer": "<div align=\"center\">" in content or "align=\"center\"" in content,
-        "has_built_with": "built with" in content.lower() or "powered by" in content.lower(),
+        "has_tiation_link": flags["has_tiation_link"],
+        "has_enterprise_mention": flags["has_enterprise_mention"],
+        "has_ngo_mention": flags["has_ngo_mention"],
+        "has_footer_section": flags["has_footer_section"],
+        "has_centered_footer": flags["has_centered_footer"],
+        "has_built_with": flags["has_built_with"],
         "content_length": len(content),
-        "ends_with_footer": content.strip().endswith("</div>") or content.strip().endswith("---"),
+        "ends_with_footer": _ends_with_footer(content),
     }
     
     # Extract potential footer content (last 500 characters)
     footer_content = content[-500:] if len(content) > 500 else content
     footer_analysis["footer_preview"] = footer_content.replace('\n', '\\n')
     
+    if rules is not None:
+        footer_analysis["rule_failures"] = rules.evaluate(content)
+    
     return footer_analysis
 
-def validate_all_footers(base_path: str) -> Dict:
-    """Validate footers across all README files"""
-    readme_files = find_readme_files(base_path)
-    results = {}
+def _ends_with_footer(content: str) -> bool:
+    """Check whether the content ends with a footer marker without copying all of it"""
+    stripped = content[-256:].rstrip()
+    if not stripped and len(content) > 256:
+        stripped = content.rstrip()
+    return stripped.endswith("</div>") or stripped.endswith("---")
+
+def _scan_whole_file(mm: mmap.mmap) -> Tuple[Dict, int, str]:
+    """Stream a mapped file in chunks for whole-file flags, length and hash
+
+    Chunks overlap by the longest marker so matches spanning a boundary are
+    found. The character count mirrors text-mode reading: UTF-8
+    continuation bytes are not counted and CRLF counts as one newline.
+    """
+    flags = {key: False for key in WHOLE_FILE_FLAGS}
+    overlap = FOOTER_MATCHER.max_literal_length - 1
+    digest = hashlib.blake2b(digest_size=16)
+    size = len(mm)
+    chars = 0
+    
+    for pos in range(0, size, SCAN_CHUNK_BYTES):
+        end = min(pos + SCAN_CHUNK_BYTES, size)
+        lo = max(0, pos - overlap)
+        window = mm[lo:end]
+        chunk = window[pos - lo:]
+        digest.update(chunk)
+        chars += len(chunk.translate(None, UTF8_CONTINUATION_BYTES))
+        chars -= window.count(b"\r\n", max(pos - lo - 1, 0))
+        
+        missing = [key for key in WHOLE_FILE_FLAGS if not flags[key]]
+        if missing:
+            flags.update(FOOTER_MATCHER.scan(window, missing))
+    
+    return flags, chars, digest.hexdigest()
+
+def _analyze_footer_tail(file_path: str, tail_bytes: int = TAIL_WINDOW_BYTES) -> Tuple[Dict, str]:
+    """Tail-only footer analysis returning the result and a raw content hash"""
+    tail_bytes = max(tail_bytes, FOOTER_PREVIEW_CHARS * 4)
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return analyze_footer_content(""), hashlib.blake2b(digest_size=16).hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            flags, chars, digest = _scan_whole_file(mm)
+            raw_tail = mm[max(0, size - tail_bytes):]
+    
+    tail = _decode_tail(raw_tail).replace('\r\n', '\n').replace('\r', '\n')
+    flags.update(FOOTER_MATCHER.scan(tail, FOOTER_FLAGS))
+    
+    footer_analysis = {
+        "has_tiation_link": flags["has_tiation_link"],
+        "has_enterprise_mention": flags["has_enterprise_mention"],
+        "has_ngo_mention": flags["has_ngo_mention"],
+        "has_footer_section": flags["has_footer_section"],
+        "has_centered_footer": flags["has_centered_footer"],
+        "has_built_with": flags["has_built_with"],
+        "content_length": chars,
+        "ends_with_footer": _ends_with_footer(tail),
+    }
+    footer_analysis["footer_preview"] = tail[-FOOTER_PREVIEW_CHARS:].replace('\n', '\\n')
+    
+    return footer_analysis, digest
+
+def analyze_footer_tail(file_path: str, tail_bytes: int = TAIL_WINDOW_BYTES) -> Dict:
+    """Analyze a README by memory-mapping it and checking only its tail
+
+    Footer checks (footer section, centered block, built-with line, ending
+    and preview) only see the last tail_bytes of the file. The link, NGO and
+    enterprise mentions and the content length still cover the whole file
+    through a chunked scan, so large files are never decoded in full.
+    """
+    try:
+        return _analyze_footer_tail(file_path, tail_bytes)[0]
+    except Exception as e:
+        return {"error": f"Could not read file: {e}"}
+
+class FooterCache:
+    """On-disk cache of analyze_footer results keyed by file stat and content hash
+
+    A file whose size and mtime_ns are unchanged is served straight from the
+    cache. If the stat differs but the content hash still matches (e.g. after
+    a fresh checkout) the cached result is reused without re-analysis.
+    Entries not seen for ttl_days are evicted, and the table is trimmed to
+    max_entries least recently seen rows. Results from different analysis
+    modes are kept apart by variant. Updated rows are written every
+    flush_rows rows and at close.
+    """
+    
+    def __init__(self, db_path: str, ttl_days: float = 30, max_entries: int = 100000,
+                 variant: str = "full", flush_rows: int = CACHE_FLUSH_ROWS):
+        self.db_path = db_path
+        self.variant = variant
+        self.flush_rows = flush_rows
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.now = time.time()
+        self.conn = sqlite3.connect(db_path)
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != CACHE_SCHEMA_VERSION:
+            self.conn.executescript("DROP TABLE IF EXISTS footer_cache; DROP TABLE IF EXISTS meta;")
+            self.conn.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS footer_cache (
+                path TEXT NOT NULL,
+                variant TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                result TEXT NOT NULL,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (path, variant)
+            );
+            CREATE INDEX IF NOT EXISTS footer_cache_last_seen ON footer_cache (last_seen);
+        """)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'analyzer_version'").fetchone()
+        if row is None or row[0] != ANALYZER_VERSION:
+            self.conn.execute("DELETE FROM footer_cache")
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('analyzer_version', ?)",
+                              (ANALYZER_VERSION,))
+        self._pending = []
+    
+    def lookup(self, path: str, st: os.stat_result) -> Tuple[Optional[Dict], Optional[str]]:
+        """Return (result, known_hash) on a stat hit, or (None, known_hash) otherwise"""
+        row = self.conn.execute(
+            "SELECT size, mtime_ns, content_hash, result FROM footer_cache WHERE path = ? AND variant = ?",
+            (path, self.variant)).fetchone()
+        if row is None:
+            return None, None
+        size, mtime_ns, known_hash, result = row
+        if size == st.st_size and mtime_ns == st.st_mtime_ns:
+            self.hits += 1
+            self._queue((path, self.variant, size, mtime_ns, known_hash, result, self.now))
+            return json.loads(result), known_hash
+        return None, known_hash
+    
+    def cached_result(self, path: str) -> Dict:
+        """Load the stored result for a path whose content hash still matches"""
+        row = self.conn.execute("SELECT result FROM footer_cache WHERE path = ? AND variant = ?",
+                                (path, self.variant)).fetchone()
+        return json.loads(row[0])
+    
+    def record_hash_hit(self, path: str, st: os.stat_result, digest: str, result: Dict):
+        """Count a content-hash hit and refresh the stored stat"""
+        self.hits += 1
+        self._queue((path, self.variant, st.st_size, st.st_mtime_ns, digest, json.dumps(result), self.now))
+    
+    def store(self, path: str, st: os.stat_result, digest: str, result: Dict):
+        """Count a miss and queue the fresh result for writing"""
+        self.misses += 1
+        self._queue((path, self.variant, st.st_size, st.st_mtime_ns, digest, json.dumps(result), self.now))
+    
+    def _queue(self, row: Tuple):
+        """Queue a row for writing, flushing once flush_rows are waiting"""
+        self._pending.append(row)
+        if len(self._pending) >= self.flush_rows:
+            self.flush()
+    
+    def flush(self):
+        """Write the queued rows in one transaction"""
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO footer_cache VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                  self._pending)
+        self._pending = []
+    
+    def close(self):
+        """Flush queued rows, evict stale entries and close the database"""
+        self.flush()
+        with self.conn:
+            self.conn.execute("DELETE FROM footer_cache WHERE last_seen < ?",
+                              (self.now - self.ttl_seconds,))
+            self.conn.execute("""
+                DELETE FROM footer_cache WHERE rowid IN (
+                    SELECT rowid FROM footer_cache ORDER BY last_seen DESC LIMIT -1 OFFSET ?
+                )""", (self.max_entries,))
+        self.conn.close()
+
+class DuplicateIndex:
+    """Share analysis results between identical README copies
+
+    Workers look up the content hash before analyzing: the first copy of a
+    blob is analyzed and every later copy reuses that result. The index
+    also records which paths share a blob so the report can list the
+    duplicate groups with the bytes and analysis time they saved.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._results = {}
+        self._seconds = {}
+        self.paths = {}
+        self.sizes = {}
+    
+    def lookup(self, digest: str) -> Optional[Dict]:
+        """Return a copy of the result already computed for this blob"""
+        with self._lock:
+            result = self._results.get(digest)
+        return dict(result) if result is not None else None
+    
+    def publish(self, digest: str, result: Dict, seconds: float):
+        """Record the result and analysis time of the first copy of a blob"""
+        with self._lock:
+            self._results.setdefault(digest, result)
+            self._seconds.setdefault(digest, seconds)
+    
+    def add_path(self, digest: str, relative_path: str, size: int):
+        """Record that relative_path holds the blob"""
+        self.paths.setdefault(digest, []).append(relative_path)
+        self.sizes[digest] = size
+    
+    def groups(self) -> List[Dict]:
+        """Duplicate groups, largest savings first"""
+        groups = []
+        for digest, paths in self.paths.items():
+            if len(paths) < 2:
+                continue
+            copies = len(paths) - 1
+            groups.append({
+                "hash": digest,
+                "paths": paths,
+                "bytes": self.sizes[digest],
+                "bytes_saved": self.sizes[digest] * copies,
+                "seconds_saved": self._seconds.get(digest, 0.0) * copies,
+            })
+        groups.sort(key=lambda group: (-group["bytes_saved"], group["paths"][0]))
+        return groups
+
+def _timed_analyze(file_path: str, known_hash: Optional[str] = None, with_hash: bool = False,
+                   tail_bytes: Optional[int] = None,
+                   dedup: Optional[DuplicateIndex] = None,
+                   rules: Optional[FooterRuleSet] = None) -> Tuple[Optional[Dict], str, float, Optional[str], float]:
+    """Run the footer analysis and report which worker handled it and how long it took
+
+    The last element is the part of the elapsed time spent reading the
+    file; the tail-only scan reads and analyzes in one pass and reports 0.
+
+    When with_hash is set the content hash is returned as well, and if it
+    equals known_hash the analysis is skipped and None is returned so the
+    caller can reuse its cached result. With tail_bytes the tail-only
+    analysis is used; its hash comes out of the same scan. With a dedup
+    index, content already analyzed under another path is not analyzed
+    again. A FooterRuleSet is evaluated on top of the built-in checks.
+    """
+    start = time.perf_counter()
+    digest = None
+    read_seconds = 0.0
+    try:
+        if tail_bytes is not None:
+            result, digest = _analyze_footer_tail(file_path, tail_bytes)
+        else:
+            raw = read_readme_bytes(file_path)
+            read_seconds = time.perf_counter() - start
+    except Exception as e:
+        result = {"error": f"Could not read file: {e}"}
+        digest = None
+    else:
+        if tail_bytes is None:
+            if with_hash or dedup is not None:
+                digest = content_hash(raw)
+            if digest is not None and digest == known_hash:
+                result = None
+            else:
+                result = dedup.lookup(digest) if dedup is not None else None
+                if result is None:
+                    analyze_start = time.perf_counter()
+                    result = analyze_footer_bytes(raw, rules)
+                    if dedup is not None:
+                        dedup.publish(digest, result, time.perf_counter() - analyze_start)
+    elapsed = time.perf_counter() - start
+    return result, threading.current_thread().name, elapsed, digest, read_seconds
+
+def iter_footer_results(base_path: str, jobs: int = 1,
+                        worker_stats: Optional[Dict] = None,
+                        cache: Optional[FooterCache] = None,
+                        tail_bytes: Optional[int] = None,
+                        discovery: str = "walk",
+                        readme_files: Optional[List[str]] = None,
+                        dedup: Optional[DuplicateIndex] = None,
+                        rules: Optional[FooterRuleSet] = None,
+                        metrics: Optional["ValidationMetrics"] = None,
+                        walker: Optional[WorkspaceWalker] = None) -> Iterator[Tuple[str, Dict]]:
+    """Yield (relative_path, result) for every README as soon as it is analyzed
+
+    With jobs > 1 the files are analyzed on a thread pool. Results are
+    always yielded in discovery order so the output is identical to a
+    serial run. If worker_stats is given it is filled with per-worker file
+    counts, characters read and busy time. If a cache is given, unchanged
+    files reuse their previous result. Setting tail_bytes switches to
+    analyze_footer_tail. discovery selects a backend from
+    DISCOVERY_BACKENDS, unless an explicit list of readme_files is given;
+    a WorkspaceWalker configures the exclusions of either backend.
+    A DuplicateIndex makes identical copies share one analysis. A
+    FooterRuleSet adds "rule_failures" to every result; it cannot be
+    combined with tail_bytes. ValidationMetrics, if given, receives the
+    discovery, cache lookup, read and analyze timings and per-file times.
+    """
+    if rules is not None and tail_bytes is not None:
+        raise ValueError("Footer rules need the full README content and cannot run in tail-only mode")
+    if readme_files is None:
+        phase_start = time.perf_counter()
+        readme_files = discover_readme_files(base_path, discovery, walker)
+        if metrics is not None:
+            metrics.add_phase("discovery", time.perf_counter() - phase_start)
+    
+    def lookup(file_path):
+        st, known_hash, cached = None, None, None
+        if cache is not None or dedup is not None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                pass
+            else:
+                if cache is not None:
+                    cached, known_hash = cache.lookup(file_path, st)
+        return file_path, st, known_hash, cached
+    
+    def run(task):
+        file_path, st, known_hash, _ = task
+        return _timed_analyze(file_path, known_hash, with_hash=st is not None,
+                              tail_bytes=tail_bytes, dedup=dedup, rules=rules)
+    
+    # Cache lookups stay on the calling thread and run at most LOOKUP_WINDOW
+    # files ahead of the one being yielded; only misses reach the workers
+    executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="footer") if jobs > 1 else None
+    window = deque()
+    files = iter(readme_files)
+    try:
+        while True:
+            phase_start = time.perf_counter()
+            for file_path in files:
+                task = lookup(file_path)
+                future = executor.submit(run, task) if executor and task[3] is None else None
+                window.append((task, future))
+                if len(window) >= LOOKUP_WINDOW:
+                    break
+            if metrics is not None:
+                metrics.add_phase("cache_lookup", time.perf_counter() - phase_start)
+            if not window:
+                break
+            
+            task, future = window.popleft()
+            file_path, st, known_hash, cached = task
+            relative_path = os.path.relpath(file_path, base_path)
+            if cached is not None:
+                if dedup is not None:
+                    dedup.add_path(known_hash, relative_path, st.st_size)
+                yield relative_path, cached
+                continue
+            
+            result, worker, elapsed, digest, read_seconds = future.result() if future else run(task)
+            if dedup is not None and digest is not None:
+                dedup.add_path(digest, relative_path, st.st_size)
+            if cache is not None and st is not None and digest is not None:
+                if result is None:
+                    result = cache.cached_result(file_path)
+                    cache.record_hash_hit(file_path, st, digest, result)
+                else:
+                    cache.store(file_path, st, digest, result)
+            
+            if worker_stats is not None:
+                stats = worker_stats.setdefault(worker, {"files": 0, "chars": 0, "seconds": 0.0})
+                stats["files"] += 1
+                stats["chars"] += result.get("content_length", 0)
+                stats["seconds"] += elapsed
+            if metrics is not None:
+                metrics.add_file(relative_path, read_seconds, elapsed - read_seconds)
+            
+            yield relative_path, result
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+def validate_all_footers(base_path: str, **options) -> Dict:
+    """Validate footers across all README files
+
+    Accepts the same options as iter_footer_results and collects its
+    output into a dict keyed by path relative to base_path.
+    """
+    return dict(iter_footer_results(base_path, **options))
+
+def print_worker_summary(worker_stats: Dict, wall_time: float):
+    """Print per-worker throughput for a validation run"""
+    print(f"\n⚙️  Worker Throughput ({wall_time:.2f}s wall):")
+    for worker in sorted(worker_stats):
+        stats = worker_stats[worker]
+        rate = stats["files"] / stats["seconds"] if stats["seconds"] else 0.0
+        print(f"   - {worker}: {stats['files']} files, {stats['chars']} chars, "
+              f"{stats['seconds']:.3f}s busy ({rate:.1f} files/s)")
+
+class ValidationMetrics:
+    """Phase timings and slowest files of one validation run
+
+    Phases are timed with the monotonic perf_counter. discovery,
+    cache_lookup and report are wall time; read and analyze are summed
+    over all files, so with several workers they can exceed the wall
+    time. Only the slowest N files are kept, in a min-heap.
+    """
+    
+    PHASES = ("discovery", "cache_lookup", "read", "analyze", "report")
+    
+    def __init__(self, slowest: int = 10):
+        self.slowest = slowest
+        self.phases = {phase: 0.0 for phase in self.PHASES}
+        self.files = 0
+        self._slowest = []
+    
+    def add_phase(self, phase: str, seconds: float):
+        """Add seconds to a phase"""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+    
+    def add_file(self, relative_path: str, read_seconds: float, analyze_seconds: float):
+        """Record the read and analyze time of one analyzed file"""
+        self.files += 1
+        self.phases["read"] += read_seconds
+        self.phases["analyze"] += analyze_seconds
+        entry = (read_seconds + analyze_seconds, relative_path)
+        if len(self._slowest) < self.slowest:
+            heapq.heappush(self._slowest, entry)
+        elif self.slowest and entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+    
+    def slowest_files(self) -> List[Tuple[float, str]]:
+        """(seconds, path) of the slowest files, slowest first"""
+        return sorted(self._slowest, reverse=True)
+    
+    def to_prometheus(self, stats: "FooterStats", wall_time: float,
+                      cache: Optional[FooterCache] = None) -> str:
+        """Render the metrics in the Prometheus text exposition format"""
+        def label(value: str) -> str:
+            return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        
+        lines = []
+        def metric(name: str, help_text: str, samples):
+            lines.append(f"# HELP footer_validation_{name} {help_text}")
+            lines.append(f"# TYPE footer_validation_{name} gauge")
+            for labels, value in samples:
+                labels = ",".join(f'{key}="{label(str(val))}"' for key, val in labels.items())
+                lines.append(f"footer_validation_{name}{{{labels}}} {value}" if labels
+                             else f"footer_validation_{name} {value}")
+        
+        metric("last_run_timestamp_seconds", "Unix time the last validation run finished", [({}, time.time())])
+        metric("duration_seconds", "Wall time of the validation run", [({}, wall_time)])
+        metric("phase_seconds", "Time spent per phase (read and analyze summed over files)",
+               [({"phase": phase}, seconds) for phase, seconds in self.phases.items()])
+        metric("files", "README files in the results", [({}, stats.total_files)])
+        metric("analyzed_files", "README files analyzed in this run rather than taken from the cache",
+               [({}, self.files)])
+        metric("errors", "README files that could not be read", [({}, stats.errors)])
+        metric("flag_files", "README files with each footer flag set",
+               [({"flag": flag}, count) for flag, count in stats.counts.items()])
+        metric("rule_failure_files", "README files failing each footer rule",
+               [({"rule": rule_id}, count) for rule_id, count in sorted(stats.rule_failures.items())])
+        if cache is not None:
+            metric("cache_lookups", "Cache lookups by outcome",
+                   [({"outcome": "hit"}, cache.hits), ({"outcome": "miss"}, cache.misses)])
+        metric("slowest_file_seconds", "Read and analyze time of the slowest files",
+               [({"path": path}, seconds) for seconds, path in self.slowest_files()])
+        return "\n".join(lines) + "\n"
+
+def print_metrics_summary(metrics: ValidationMetrics):
+    """Print phase timings and the slowest files of a validation run"""
+    print(f"\n⏱️  Phase Timings:")
+    for phase, seconds in metrics.phases.items():
+        print(f"   - {phase}: {seconds:.3f}s")
+    slowest = metrics.slowest_files()
+    if slowest:
+        print(f"\n🐢 Slowest Files:")
+        for seconds, path in slowest:
+            print(f"   - {path}: {seconds * 1000:.2f}ms")
+
+class FooterStats:
+    """One-pass statistics accumulator over footer results
+
+    Counts every flag, keeps only the first few paths missing the link or
+    the NGO mention, and retains full data only for the priority (top-level)
+    READMEs, so memory does not grow with the number of files. The same
+    object feeds the markdown report, the console summary and to_dict().
+    """
+    
+    COUNTED_FLAGS = ("has_tiation_link", "has_ngo_mention", "has_enterprise_mention", "has_footer_section")
+    MISSING_FLAGS = ("has_tiation_link", "has_ngo_mention")
+    
+    def __init__(self, sample_size: int = 10):
+        self.sample_size = sample_size
+        self.total_files = 0
+        self.errors = 0
+        self.counts = {flag: 0 for flag in self.COUNTED_FLAGS}
+        self.missing_counts = {flag: 0 for flag in self.MISSING_FLAGS}
+        self.missing_samples = {flag: [] for flag in self.MISSING_FLAGS}
+        self.rule_failures = {}
+        self.rule_samples = {}
+        self.priority_files = []
+    
+    def add(self, path: str, data: Dict):
+        """Fold one README result into the statistics"""
+        self.total_files += 1
+        for flag in self.COUNTED_FLAGS:
+            if data.get(flag, False):
+                self.counts[flag] += 1
+        
+        if data.get("error"):
+            self.errors += 1
+        else:
+            for flag in self.MISSING_FLAGS:
+                if not data.get(flag, False):
+                    self.missing_counts[flag] += 1
+                    if len(self.missing_samples[flag]) < self.sample_size:
+                        self.missing_samples[flag].append(path)
+            for rule_id in data.get("rule_failures", ()):
+                self._add_rule_failure(rule_id, path)
+        
+        # Main project READMEs
+        if path.count('/') <= 1 and 'README.md' in path:
+            self.priority_files.append((path, data))
+    
+    def _add_rule_failure(self, rule_id: str, path: str):
+        self.rule_failures[rule_id] = self.rule_failures.get(rule_id, 0) + 1
+        samples = self.rule_samples.setdefault(rule_id, [])
+        if len(samples) < self.sample_size:
+            samples.append(path)
+    
+    def update(self, items) -> "FooterStats":
+        """Fold an iterable of (path, result) pairs, e.g. results.items()"""
+        for path, data in items:
+            self.add(path, data)
+        return self
+    
+    def update_store(self, store: "FooterResultStore") -> "FooterStats":
+        """Fold a FooterResultStore straight from its columns
+
+        Equivalent to update(store.items()), but flag counts are taken over
+        the packed flag bytes with bytes.translate and only the paths and
+        records that the statistics keep are rebuilt.
+        """
+        flags = store.flags.tobytes()
+        
+        def positions(predicate):
+            """Translate each flag byte to 1/0 according to predicate"""
+            return flags.translate(bytes(1 if predicate(bits) else 0 for bits in range(256)))
+        
+        self.total_files += len(flags)
+        self.errors += positions(lambda bits: bits & store.ERROR_BIT).count(1)
+        for flag in self.COUNTED_FLAGS:
+            bit = 1 << store.FLAGS.index(flag)
+            self.counts[flag] += positions(lambda bits: bits & bit).count(1)
+        
+        for flag in self.MISSING_FLAGS:
+            bit = 1 << store.FLAGS.index(flag)
+            missing = positions(lambda bits: not bits & (bit | store.ERROR_BIT))
+            self.missing_counts[flag] += missing.count(1)
+            i = missing.find(1)
+            while i != -1 and len(self.missing_samples[flag]) < self.sample_size:
+                self.missing_samples[flag].append(store.path(i))
+                i = missing.find(1, i + 1)
+        
+        offsets = store.failure_offsets
+        for i in range(len(flags)):
+            if offsets[i] != offsets[i + 1]:
+                path = store.path(i)
+                for rule_id in store.rule_failures(i):
+                    self._add_rule_failure(rule_id, path)
+        
+        top_level_dirs = {i for i, directory in enumerate(store.dirs) if '/' not in directory}
+        for i, dir_id in enumerate(store.dir_index):
+            if dir_id in top_level_dirs:
+                path = store.path(i)
+                if 'README.md' in path:
+                    self.priority_files.append((path, store.record(i)))
+        return self
     
-    for file_path in readme_files:
-        relative_path = os.path.relpath(file_path, base_path)
-        results[relative_path] = analyze_footer(file_path)
+    def percent(self, flag: str) -> float:
+        """Share of files with a flag set, as a percentage"""
+        return self.counts[flag] / max(self.total_files, 1) * 100
     
-    return results
+    def to_dict(self) -> Dict:
+        """Summary in a JSON-serializable form"""
+        return {
+            "total_files": self.total_files,
+            "errors": self.errors,
+            "counts": dict(self.counts),
+            "missing": {flag: {"count": self.missing_counts[flag], "sample": list(self.missing_samples[flag])}
+                        for flag in self.MISSING_FLAGS},
+            "rule_failures": {rule_id: {"count": count, "sample": list(self.rule_samples[rule_id])}
+                              for rule_id, count in self.rule_failures.items()},
+            "priority_files": [path for path, _ in self.priority_files],
+        }
 
-def generate_report(results: Dict) -> str:
-    """Generate a comprehensive validation report"""
-    report = ["# Footer Validation Report", ""]
+def iter_report_lines(stats: FooterStats, duplicate_groups: Optional[List[Dict]] = None) -> Iterator[str]:
+    """Yield the markdown report line by line from accumulated statistics"""
+    yield "# Footer Validation Report"
+    yield ""
     
     # Summary statistics
-    total_files = len(results)
-    files_with_tiation_link = sum(1 for r in results.values() if r.get("has_tiation_link", False))
-    files_with_ngo_mention = sum(1 for r in results.values() if r.get("has_ngo_mention", False))
-    files_with_enterprise = sum(1 for r in results.values() if r.get("has_enterprise_mention", False))
-    files_with_footer = sum(1 for r in results.values() if r.get("has_footer_section", False))
-    
-    report.extend([
-        f"## Summary Statistics",
-        f"- **Total README files analyzed**: {total_files}",
-        f"- **Files with tiation.github.io link**: {files_with_tiation_link} ({files_with_tiation_link/total_files*100:.1f}%)",
-        f"- **Files with NGO mention**: {files_with_ngo_mention} ({files_with_ngo_mention/total_files*100:.1f}%)",
-        f"- **Files with enterprise mention**: {files_with_enterprise} ({files_with_enterprise/total_files*100:.1f}%)",
-        f"- **Files with footer section**: {files_with_footer} ({files_with_footer/total_files*100:.1f}%)",
-        ""
-    ])
+    counts = stats.counts
+    yield f"## Summary Statistics"
+    yield f"- **Total README files analyzed**: {stats.total_files}"
+    yield f"- **Files with tiation.github.io link**: {counts['has_tiation_link']} ({stats.percent('has_tiation_link'):.1f}%)"
+    yield f"- **Files with NGO mention**: {counts['has_ngo_mention']} ({stats.percent('has_ngo_mention'):.1f}%)"
+    yield f"- **Files with enterprise mention**: {counts['has_enterprise_mention']} ({stats.percent('has_enterprise_mention'):.1f}%)"
+    yield f"- **Files with footer section**: {counts['has_footer_section']} ({stats.percent('has_footer_section'):.1f}%)"
+    yield ""
     
     # Files missing key elements
-    report.append("## Files Missing Key Elements")
-    report.append("")
-    
-    missing_tiation = [path for path, data in results.items() 
-                      if not data.get("has_tiation_link", False) and not data.get("error")]
-    if missing_tiation:
-        report.append("### Missing tiation.github.io Link:")
-        for path in missing_tiation[:10]:  # Show first 10
-            report.append(f"- {path}")
-        if len(missing_tiation) > 10:
-            report.append(f"- ... and {len(missing_tiation) - 10} more")
-        report.append("")
-    
-    missing_ngo = [path for path, data in results.items() 
-                   if not data.get("has_ngo_mention", False) and not data.get("error")]
-    if missing_ngo:
-        report.append("### Missing NGO Mention:")
-        for path in missing_ngo[:10]:  # Show first 10
-            report.append(f"- {path}")
-        if len(missing_ngo) > 10:
-            report.append(f"- ... and {len(missing_ngo) - 10} more")
-        report.append("")
+    yield "## Files Missing Key Elements"
+    yield ""
+    
+    for flag, title in (("has_tiation_link", "Missing tiation.github.io Link:"),
+                        ("has_ngo_mention", "Missing NGO Mention:")):
+        missing = stats.missing_counts[flag]
+        if missing:
+            yield f"### {title}"
+            for path in stats.missing_samples[flag]:
+                yield f"- {path}"
+            if missing > stats.sample_size:
+                yield f"- ... and {missing - stats.sample_size} more"
+            yield ""
+    
+    if stats.rule_failures:
+        yield "## Footer Rule Failures"
+        yield ""
+        for rule_id, count in sorted(stats.rule_failures.items(), key=lambda item: (-item[1], item[0])):
+            yield f"### {rule_id}: {count} files"
+            for path in stats.rule_samples[rule_id]:
+                yield f"- {path}"
+            if count > stats.sample_size:
+                yield f"- ... and {count - stats.sample_size} more"
+            yield ""
     
     # Priority files for review (main project READMEs)
-    priority_files = [path for path in results.keys() 
-                     if path.count('/') <= 1 and 'README.md' in path]
-    
-    if priority_files:
-        report.append("## Priority Files Analysis (Main Project READMEs)")
-        report.append("")
-        for path in priority_files:
-            data = results[path]
+    if stats.priority_files:
+        yield "## Priority Files Analysis (Main Project READMEs)"
+        yield ""
+        for path, data in stats.priority_files:
             if data.get("error"):
-                report.append(f"### ❌ {path} - ERROR: {data['error']}")
+                yield f"### ❌ {path} - ERROR: {data['error']}"
                 continue
-                
+            
             status_icons = []
             status_icons.append("✅" if data.get("has_tiation_link") else "❌")
             status_icons.append("🏢" if data.get("has_enterprise_mention") else "⚪")
             status_icons.append("🌟" if data.get("has_ngo_mention") else "⚪")
             status_icons.append("📄" if data.get("has_footer_section") else "⚪")
             
-            report.append(f"### {' '.join(status_icons)} {path}")
-            report.append(f"- Tiation Link: {'✅' if data.get('has_tiation_link') else '❌'}")
-            report.append(f"- Enterprise Grade: {'✅' if data.get('has_enterprise_mention') else '❌'}")
-            report.append(f"- NGO Mission: {'✅' if data.get('has_ngo_mention') else '❌'}")
-            report.append(f"- Footer Section: {'✅' if data.get('has_footer_section') else '❌'}")
-            report.append("")
+            yield f"### {' '.join(status_icons)} {path}"
+            yield f"- Tiation Link: {'✅' if data.get('has_tiation_link') else '❌'}"
+            yield f"- Enterprise Grade: {'✅' if data.get('has_enterprise_mention') else '❌'}"
+            yield f"- NGO Mission: {'✅' if data.get('has_ngo_mention') else '❌'}"
+            yield f"- Footer Section: {'✅' if data.get('has_footer_section') else '❌'}"
+            yield ""
+    
+    if duplicate_groups:
+        yield from _duplicate_groups_section(duplicate_groups)
+
+def render_report(stats: FooterStats, out, duplicate_groups: Optional[List[Dict]] = None):
+    """Stream the markdown report to a text file handle"""
+    for i, line in enumerate(iter_report_lines(stats, duplicate_groups)):
+        if i:
+            out.write("\n")
+        out.write(line)
+
+def generate_report(results: Union[Dict, "FooterResultStore"], duplicate_groups: Optional[List[Dict]] = None) -> str:
+    """Generate a comprehensive validation report from a results dict or a FooterResultStore"""
+    if isinstance(results, FooterResultStore):
+        stats = FooterStats().update_store(results)
+    else:
+        stats = FooterStats().update(results.items())
+    return "\n".join(iter_report_lines(stats, duplicate_groups))
+
+def _duplicate_groups_section(duplicate_groups: List[Dict]) -> List[str]:
+    """Report lines for README copies that share identical content"""
+    duplicate_files = sum(len(group["paths"]) for group in duplicate_groups)
+    bytes_saved = sum(group["bytes_saved"] for group in duplicate_groups)
+    seconds_saved = sum(group["seconds_saved"] for group in duplicate_groups)
+    
+    lines = [
+        "## Duplicate Groups",
+        "",
+        f"- **Groups of identical READMEs**: {len(duplicate_groups)} ({duplicate_files} files)",
+        f"- **Bytes not re-analyzed**: {bytes_saved:,}",
+        f"- **Analysis time saved**: {seconds_saved * 1000:.1f} ms",
+        "",
+    ]
+    for group in duplicate_groups[:10]:  # Show first 10
+        lines.append(f"### {len(group['paths'])} copies ({group['bytes']:,} bytes each)")
+        lines.extend(f"- {path}" for path in group["paths"])
+        lines.append("")
+    if len(duplicate_groups) > 10:
+        lines.append(f"- ... and {len(duplicate_groups) - 10} more groups")
+        lines.append("")
+    return lines
+
+def _atomic_write_text(path: str, text: str, errors: str = "strict"):
+    """Write a file via a temporary sibling and rename it into place"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8", errors=errors) as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+def write_report(path: str, stats: FooterStats, duplicate_groups: Optional[List[Dict]] = None):
+    """Stream the markdown report to a temporary sibling and rename it into place"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        render_report(stats, f, duplicate_groups)
+    os.replace(tmp_path, path)
+
+def write_outputs(base_path: str, results: Dict, data_format: str = "json",
+                  duplicate_groups: Optional[List[Dict]] = None) -> FooterStats:
+    """Write the markdown report and the data file next to each other in base_path"""
+    stats = FooterStats().update(results.items())
+    write_report(os.path.join(base_path, REPORT_FILENAME), stats, duplicate_groups)
+    write_data(os.path.join(base_path, DATA_FILENAMES[data_format]), results, data_format)
+    return stats
+
+def write_data(path: str, results: Dict, data_format: str = "json"):
+    """Write results to a data file in the given format"""
+    if data_format in DATA_WRITERS:
+        with DATA_WRITERS[data_format](path) as writer:
+            for relative_path, result in results.items():
+                writer.write(relative_path, result)
+    else:
+        _atomic_write_text(path, json.dumps(results, indent=2))
+
+class NdjsonResultWriter:
+    """Stream results to an NDJSON file, one record per README
+
+    Records go to a temporary sibling file as they arrive and are renamed
+    over the destination only when the writer is closed without error, so
+    readers never see a partial file.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = f"{path}.tmp"
+        self.count = 0
+        self._file = open(self.tmp_path, "w", encoding="utf-8")
+    
+    def write(self, relative_path: str, result: Dict):
+        """Append one record and flush it so it is visible immediately"""
+        self._file.write(json.dumps({"path": relative_path, "result": result}) + "\n")
+        self._file.flush()
+        self.count += 1
+    
+    def close(self, commit: bool = True):
+        """Finish the file, renaming it into place if commit is set"""
+        self._file.close()
+        if commit:
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.remove(self.tmp_path)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)
+
+def iter_ndjson_results(path: str) -> Iterator[Tuple[str, Dict]]:
+    """Lazily yield (relative_path, result) records from an NDJSON results file"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                yield record["path"], record["result"]
+
+def load_results(path: str) -> Dict:
+    """Load results from either the JSON or the NDJSON data file"""
+    if path.endswith(".ndjson"):
+        return dict(iter_ndjson_results(path))
+    if path.endswith(".bin"):
+        return FooterResultStore.load(path).to_dict()
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_stats(path: str) -> FooterStats:
+    """Report statistics for a data file
+
+    A .bin store is folded straight from its columns and NDJSON is
+    streamed, so neither builds the full results dict.
+    """
+    if path.endswith(".bin"):
+        return FooterStats().update_store(FooterResultStore.load(path))
+    if path.endswith(".ndjson"):
+        return FooterStats().update(iter_ndjson_results(path))
+    return FooterStats().update(load_results(path).items())
+
+class FooterResultStore:
+    """Columnar in-memory and on-disk store of footer results
+
+    Per file the store keeps one flag byte (the boolean results plus an
+    error bit), the content length and indexes into interned directory and
+    file name tables. Previews and error messages live out of line in one
+    UTF-8 blob addressed by an offset array. Rule failures are stored as
+    ids into an interned rule table, again addressed by an offset array.
+    save() writes the columns as little-endian arrays behind a small
+    header, and load() reads them back with array.frombytes, so no
+    per-record parsing happens until a record is actually requested.
+    Version 1 stores, written before rules existed, still load.
+    """
+    
+    MAGIC = b"FVRS"
+    VERSION = 2
+    HEADER = struct.Struct("<4sHHIIIQQQ")
+    RULES_HEADER = struct.Struct("<IQQ")
+    HAS_RULES = 1
+    FLAGS = RESULT_FLAGS
+    ERROR_BIT = 1 << 7
+    
+    def __init__(self):
+        self.dirs = []
+        self.names = []
+        self._dir_ids = {}
+        self._name_ids = {}
+        self.dir_index = array("I")
+        self.name_index = array("I")
+        self.flags = array("B")
+        self.lengths = array("Q")
+        self.text_offsets = array("Q", [0])
+        self.texts = bytearray()
+        self.has_rules = False
+        self.rules = []
+        self._rule_ids = {}
+        self.failure_offsets = array("Q", [0])
+        self.failure_ids = array("I")
+    
+    def __len__(self) -> int:
+        return len(self.flags)
+    
+    def _intern(self, value: str, table: List[str], ids: Dict[str, int]) -> int:
+        """Index of value in table, appending it if new"""
+        index = ids.get(value)
+        if index is None:
+            index = ids[value] = len(table)
+            table.append(value)
+        return index
+    
+    def add(self, relative_path: str, result: Dict):
+        """Append one result"""
+        directory, _, name = relative_path.rpartition("/")
+        if self._dir_ids is None:
+            # Loaded stores build their lookup tables only when appended to
+            self._dir_ids = {value: i for i, value in enumerate(self.dirs)}
+            self._name_ids = {value: i for i, value in enumerate(self.names)}
+            self._rule_ids = {value: i for i, value in enumerate(self.rules)}
+        self.dir_index.append(self._intern(directory, self.dirs, self._dir_ids))
+        self.name_index.append(self._intern(name, self.names, self._name_ids))
+        
+        if "error" in result:
+            bits, length, text = self.ERROR_BIT, 0, result["error"]
+        else:
+            bits = 0
+            for bit, flag in enumerate(self.FLAGS):
+                if result.get(flag):
+                    bits |= 1 << bit
+            length, text = result.get("content_length", 0), result.get("footer_preview", "")
+        if not isinstance(self.texts, bytearray):
+            self.texts = bytearray(self.texts)
+        self.flags.append(bits)
+        self.lengths.append(length)
+        self.texts += text.encode("utf-8", "surrogatepass")
+        self.text_offsets.append(len(self.texts))
+        if "rule_failures" in result:
+            self.has_rules = True
+            for rule_id in result["rule_failures"]:
+                self.failure_ids.append(self._intern(rule_id, self.rules, self._rule_ids))
+        self.failure_offsets.append(len(self.failure_ids))
+    
+    def path(self, i: int) -> str:
+        """Relative path of record i"""
+        directory = self.dirs[self.dir_index[i]]
+        name = self.names[self.name_index[i]]
+        return f"{directory}/{name}" if directory else name
+    
+    def _text(self, i: int) -> str:
+        return bytes(self.texts[self.text_offsets[i]:self.text_offsets[i + 1]]).decode("utf-8", "surrogatepass")
+    
+    def record(self, i: int) -> Dict:
+        """Rebuild the analyze_footer dict for record i, in the original key order"""
+        bits = self.flags[i]
+        if bits & self.ERROR_BIT:
+            return {"error": self._text(i)}
+        result = {flag: bool(bits & (1 << bit)) for bit, flag in enumerate(self.FLAGS[:6])}
+        result["content_length"] = self.lengths[i]
+        result["ends_with_footer"] = bool(bits & (1 << 6))
+        result["footer_preview"] = self._text(i)
+        if self.has_rules:
+            result["rule_failures"] = self.rule_failures(i)
+        return result
     
-    return "\n".join(report)
+    def rule_failures(self, i: int) -> List[str]:
+        """Ids of the rules record i violates"""
+        start, end = self.failure_offsets[i], self.failure_offsets[i + 1]
+        return [self.rules[rule] for rule in self.failure_ids[start:end]]
+    
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """Yield (relative_path, result) pairs in stored order"""
+        for i in range(len(self)):
+            yield self.path(i), self.record(i)
+    
+    def to_dict(self) -> Dict:
+        """Rebuild the results dict used by the JSON output"""
+        return dict(self.items())
+    
+    def save(self, path: str):
+        """Write the store atomically to path"""
+        columns = [self.dir_index, self.name_index, self.flags, self.lengths, self.text_offsets,
+                   self.failure_offsets, self.failure_ids]
+        if sys.byteorder == "big":
+            columns = [array(column.typecode, column) for column in columns]
+            for column in columns:
+                column.byteswap()
+        dir_blob = "\0".join(self.dirs).encode("utf-8", "surrogateescape")
+        name_blob = "\0".join(self.names).encode("utf-8", "surrogateescape")
+        rule_blob = "\0".join(self.rules).encode("utf-8", "surrogateescape")
+        
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.HAS_RULES if self.has_rules else 0,
+                                     len(self), len(self.dirs), len(self.names),
+                                     len(dir_blob), len(name_blob), len(self.texts)))
+            f.write(self.RULES_HEADER.pack(len(self.rules), len(rule_blob), len(self.failure_ids)))
+            for column in columns:
+                column.tofile(f)
+            f.write(dir_blob)
+            f.write(name_blob)
+            f.write(self.texts)
+            f.write(rule_blob)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str) -> "FooterResultStore":
+        """Read a store written by save()"""
+        with open(path, "rb") as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+        if len(data) < cls.HEADER.size:
+            raise ValueError(f"{path} is not a version {cls.VERSION} footer result store")
+        magic, version, header_flags, count, num_dirs, num_names, dir_len, name_len, text_len = \
+            cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC or version not in (1, cls.VERSION):
+            raise ValueError(f"{path} is not a version {cls.VERSION} footer result store")
+        
+        store = cls()
+        offset = cls.HEADER.size
+        columns = [("dir_index", count), ("name_index", count), ("flags", count),
+                   ("lengths", count), ("text_offsets", count + 1)]
+        num_rules = rule_len = 0
+        if version > 1:
+            num_rules, rule_len, failure_count = cls.RULES_HEADER.unpack_from(data, offset)
+            offset += cls.RULES_HEADER.size
+            columns += [("failure_offsets", count + 1), ("failure_ids", failure_count)]
+        else:
+            store.failure_offsets = array("Q", bytes(8 * (count + 1)))
+        view = memoryview(data)
+        for name, size in columns:
+            column = array(getattr(store, name).typecode)
+            end = offset + size * column.itemsize
+            column.frombytes(view[offset:end])
+            if sys.byteorder == "big":
+                column.byteswap()
+            setattr(store, name, column)
+            offset = end
+        
+        store.dirs = bytes(view[offset:offset + dir_len]).decode("utf-8", "surrogateescape").split("\0")
+        offset += dir_len
+        store.names = bytes(view[offset:offset + name_len]).decode("utf-8", "surrogateescape").split("\0")
+        offset += name_len
+        # Previews stay a view into the mapped file until something is appended
+        store.texts = view[offset:offset + text_len]
+        offset += text_len
+        store.rules = bytes(view[offset:offset + rule_len]).decode("utf-8", "surrogateescape").split("\0")
+        # An empty table still splits into one empty string
+        store.dirs = store.dirs[:num_dirs]
+        store.names = store.names[:num_names]
+        store.rules = store.rules[:num_rules]
+        store.has_rules = bool(header_flags & cls.HAS_RULES)
+        store._dir_ids = store._name_ids = store._rule_ids = None
+        return store
+
+class BinaryResultWriter:
+    """Collect results into a FooterResultStore and save it when closed without error"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.store = FooterResultStore()
+    
+    def write(self, relative_path: str, result: Dict):
+        """Append one record"""
+        self.store.add(relative_path, result)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.store.save(self.path)
+
+DATA_FILENAMES = {
+    "json": DATA_FILENAME,
+    "ndjson": NDJSON_FILENAME,
+    "binary": BINARY_FILENAME,
+}
+DATA_WRITERS = {
+    "ndjson": NdjsonResultWriter,
+    "binary": BinaryResultWriter,
+}
+
+# Standard Enterprise Footer from FOOTER_TEMPLATE.md
+CANONICAL_FOOTER = """---
+
+<div align="center">
+
+**🏗️ Built with enterprise-grade excellence by [Tiation](https://tiation.github.io/) 🏗️**
+
+*In partnership with ChaseWhiteRabbit NGO - Empowering communities through ethical technology*
+
+[![Tiation Ecosystem](https://img.shields.io/badge/🔮_Ecosystem-Tiation-00FFFF?style=for-the-badge&labelColor=0A0A0A)](https://tiation.github.io/)
+[![Enterprise Grade](https://img.shields.io/badge/🏢_Enterprise-Grade-FF00FF?style=for-the-badge&labelColor=0A0A0A)](https://tiation.github.io/)
+[![NGO Mission](https://img.shields.io/badge/🌟_NGO-Mission_Driven-00FFFF?style=for-the-badge&labelColor=0A0A0A)](https://tiation.github.io/)
+
+**[Explore the Tiation Platform →](https://tiation.github.io/)**
+
+</div>
+"""
+
+# A --- line, one centered div and nothing but whitespace up to the end of the file
+FOOTER_BLOCK_PATTERN = re.compile(r"(?:^|\n)---[ \t]*\r?\n\s*<div align=\"center\">((?:(?!</div>).)*)</div>\s*\Z",
+                                  re.DOTALL)
+FOOTER_BLOCK_MARKERS = ("tiation", "built with")
+
+def needs_footer_fix(result: Dict) -> bool:
+    """Whether an analyzed README lacks the footer elements --fix provides"""
+    return "error" not in result and not all(result.get(flag) for flag in FooterStats.MISSING_FLAGS)
+
+def apply_canonical_footer(content: str, footer: str = CANONICAL_FOOTER) -> str:
+    """Replace a trailing footer block with footer, or append footer
+
+    Only a block that is itself a footer is replaced: a --- line followed by
+    a single centered div mentioning Tiation or "Built with", and nothing
+    after the div but whitespace. Any other content is kept and the footer
+    is appended below it. Line endings follow the file.
+    """
+    newline = "\r\n" if "\r\n" in content else "\n"
+    footer = footer.replace("\n", newline)
+    # ^ only matches at the real start of content, never at the search position
+    match = FOOTER_BLOCK_PATTERN.search(content, max(0, len(content) - (len(footer) * 4 + 4096)))
+    if match and any(marker in match.group(1).lower() for marker in FOOTER_BLOCK_MARKERS):
+        body = content[:len(content) - len(match.group(0))]
+    else:
+        body = content
+    body = body.rstrip()
+    return f"{body}{newline}{newline}{footer}" if body else footer
+
+def _repository_root(file_path: str, base_path: str, roots: Dict[str, str]) -> str:
+    """Closest ancestor of file_path holding a .git entry, else its top-level directory
+
+    roots caches the git root found for each directory visited, or "" when
+    there is none up to base_path; the top-level fallback depends on the
+    file and is never cached.
+    """
+    directory = os.path.dirname(file_path)
+    seen = []
+    git_root = ""
+    while True:
+        if directory in roots:
+            git_root = roots[directory]
+            break
+        seen.append(directory)
+        if os.path.exists(os.path.join(directory, ".git")):
+            git_root = directory
+            break
+        parent = os.path.dirname(directory)
+        if directory == base_path or parent == directory:
+            break
+        directory = parent
+    for directory in seen:
+        roots[directory] = git_root
+    if git_root:
+        return git_root
+    relative = os.path.relpath(file_path, base_path).split(os.sep)
+    return os.path.join(base_path, relative[0]) if len(relative) > 1 else base_path
+
+def _write_repository_batch(changes: List[Tuple[str, str]]) -> Optional[str]:
+    """Stage every change of one repository as a temp file, then rename them all into place
+
+    Nothing is renamed unless every file was staged, so a repository is
+    never left half fixed by a write error. Returns an error message or
+    None.
+    """
+    staged = []
+    try:
+        for file_path, text in changes:
+            tmp_path = f"{file_path}.footerfix.tmp"
+            with open(tmp_path, "w", encoding="utf-8", errors="surrogateescape", newline="") as f:
+                f.write(text)
+            staged.append(tmp_path)
+            os.chmod(tmp_path, os.stat(file_path).st_mode & 0o7777)
+    except OSError as e:
+        for tmp_path in staged:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        return str(e)
+    for (file_path, _), tmp_path in zip(changes, staged):
+        os.replace(tmp_path, file_path)
+    return None
+
+def fix_footers(base_path: str, relative_paths: List[str], dry_run: bool = False,
+                jobs: int = 1, footer: str = CANONICAL_FOOTER) -> Dict:
+    """Give every listed README the canonical footer
+
+    New contents are computed for all files first and grouped by
+    repository; each repository is then written as one batch of atomic
+    temp-file renames, several repositories at a time with jobs > 1.
+    Bytes that are not valid UTF-8 are carried through unchanged
+    (surrogateescape), also in the diff. With dry_run nothing is written.
+    Returns the unified diff of all changes together with fixed counts and
+    the repositories or files that failed.
+    """
+    roots = {}
+    groups = {}
+    diff = []
+    failed = {}
+    for relative_path in sorted(relative_paths):
+        file_path = os.path.join(base_path, relative_path)
+        try:
+            with open(file_path, "r", encoding="utf-8", errors="surrogateescape", newline="") as f:
+                content = f.read()
+        except OSError as e:
+            failed[relative_path] = str(e)
+            continue
+        fixed = apply_canonical_footer(content, footer)
+        if fixed == content:
+            continue
+        diff.extend(difflib.unified_diff(content.splitlines(keepends=True), fixed.splitlines(keepends=True),
+                                         f"a/{relative_path}", f"b/{relative_path}"))
+        groups.setdefault(_repository_root(file_path, base_path, roots), []).append((file_path, fixed))
+    
+    failed_roots = set()
+    if not dry_run and groups:
+        executor = ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="footer-fix") if jobs > 1 else None
+        try:
+            outcomes = (executor.map if executor else map)(_write_repository_batch, groups.values())
+            for root, error in zip(list(groups), outcomes):
+                if error is not None:
+                    failed_roots.add(root)
+                    failed[os.path.relpath(root, base_path)] = error
+        finally:
+            if executor is not None:
+                executor.shutdown()
+    
+    return {
+        "diff": "".join(line if line.endswith("\n") else line + "\n\\ No newline at end of file\n"
+                        for line in diff),
+        "files": sum(len(changes) for root, changes in groups.items() if root not in failed_roots),
+        "repositories": len(groups) - len(failed_roots),
+        "failed": failed,
+    }
 
-def main():
+class InotifyWatcher:
+    """Recursive Linux inotify watch over the README-bearing directories of a tree"""
+    
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_ISDIR = 0x40000000
+    WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+                  IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR)
+    EVENT_HEADER = struct.Struct("iIII")
+    
+    def __init__(self, base_path: str, walker: Optional[WorkspaceWalker] = None):
+        self.base_path = base_path
+        self.walker = walker or WorkspaceWalker()
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.paths = {}
+        self.add_tree(base_path)
+    
+    def add_tree(self, root: str) -> List[str]:
+        """Watch root and every directory below it the walker does not exclude, returning READMEs found"""
+        start = os.path.relpath(root, self.base_path).replace(os.sep, "/")
+        start = "" if start == "." else start
+        if start and self.walker.is_excluded(self.base_path, start, True):
+            return []
+        self._add_watch(root)
+        readme_files = []
+        for entry, is_dir in self.walker.iter_entries(self.base_path, lambda name: name.lower() == 'readme.md',
+                                                      start=start):
+            if not is_dir:
+                readme_files.append(entry.path)
+            elif not entry.is_symlink():
+                self._add_watch(entry.path)
+        return readme_files
+    
+    def _add_watch(self, directory: str):
+        """Register one directory with inotify"""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory} "
+                          "(check fs.inotify.max_user_watches)")
+        self.paths[wd] = directory
+    
+    def read_events(self, timeout: Optional[float]) -> List[Tuple[int, str]]:
+        """Wait up to timeout seconds and return (mask, absolute path) events"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        
+        events = []
+        buffer = os.read(self.fd, 1 << 16)
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = self.EVENT_HEADER.unpack_from(buffer, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            
+            if mask & self.IN_Q_OVERFLOW:
+                events.append((mask, self.base_path))
+                continue
+            directory = self.paths.get(wd)
+            if mask & self.IN_IGNORED:
+                self.paths.pop(wd, None)
+            if directory is None:
+                continue
+            events.append((mask, os.path.join(directory, name) if name else directory))
+        return events
+    
+    def close(self):
+        """Release the inotify descriptor"""
+        os.close(self.fd)
+
+def watch_footers(base_path: str, results: Dict, debounce: float = 0.2,
+                  tail_bytes: Optional[int] = None, data_format: str = "json",
+                  rules: Optional[FooterRuleSet] = None, walker: Optional[WorkspaceWalker] = None):
+    """Keep results and the output files up to date as READMEs change
+
+    Events are collected until the tree has been quiet for debounce
+    seconds; then only the affected READMEs are re-analyzed and the report
+    and JSON are rewritten. New directories are watched as they appear.
+    Paths the walker excludes are neither watched nor analyzed. Runs until
+    interrupted.
+    """
+    walker = walker or WorkspaceWalker()
+    watcher = InotifyWatcher(base_path, walker)
+    if tail_bytes is None:
+        analyze = lambda path: analyze_footer(path, rules)
+    else:
+        analyze = lambda path: analyze_footer_tail(path, tail_bytes)
+    print(f"👀 Watching {len(watcher.paths)} directories under {base_path} (Ctrl+C to stop)")
+    
+    try:
+        while True:
+            dirty = set()
+            removed_dirs = set()
+            rescan = False
+            events = watcher.read_events(None)
+            while events:
+                for mask, path in events:
+                    if mask & InotifyWatcher.IN_Q_OVERFLOW:
+                        rescan = True
+                    elif mask & InotifyWatcher.IN_ISDIR:
+                        if mask & (InotifyWatcher.IN_CREATE | InotifyWatcher.IN_MOVED_TO):
+                            dirty.update(watcher.add_tree(path))
+                        elif mask & (InotifyWatcher.IN_DELETE | InotifyWatcher.IN_MOVED_FROM):
+                            removed_dirs.add(os.path.relpath(path, base_path))
+                    elif (os.path.basename(path).lower() == 'readme.md' and not walker.is_excluded(
+                            base_path, os.path.relpath(path, base_path).replace(os.sep, "/"))):
+                        dirty.add(path)
+                events = watcher.read_events(debounce)
+            
+            start = time.perf_counter()
+            if rescan:
+                results.clear()
+                results.update(validate_all_footers(base_path, tail_bytes=tail_bytes, rules=rules, walker=walker))
+            for rel_dir in removed_dirs:
+                for path in [p for p in results if p.startswith(rel_dir + os.sep)]:
+                    del results[path]
+            for file_path in sorted(dirty):
+                relative_path = os.path.relpath(file_path, base_path)
+                if os.path.isfile(file_path):
+                    results[relative_path] = analyze(file_path)
+                else:
+                    results.pop(relative_path, None)
+            
+            if dirty or removed_dirs or rescan:
+                write_outputs(base_path, results, data_format)
+                print(f"🔄 Updated {len(dirty)} files in {time.perf_counter() - start:.3f}s")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        watcher.close()
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an --shard value of the form i/N (1 <= i <= N)"""
+    match = re.fullmatch(r"(\d+)/(\d+)", value)
+    if not match or not 1 <= int(match.group(1)) <= int(match.group(2)):
+        raise argparse.ArgumentTypeError(f"expected i/N with 1 <= i <= N, got {value!r}")
+    return int(match.group(1)), int(match.group(2))
+
+def shard_of(relative_path: str, count: int) -> int:
+    """Shard (1-based) a README belongs to, the same on every host and run"""
+    key = relative_path.replace(os.sep, "/").encode("utf-8", "surrogateescape")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "big") % count + 1
+
+def shard_filename(filename: str, index: int, count: int) -> str:
+    """Name of a shard's partial file, e.g. footer_validation_data.shard-1-of-4.json"""
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.shard-{index}-of-{count}{ext}"
+
+def tree_digest(relative_paths: List[str]) -> str:
+    """Fingerprint of a discovered README list, for checking that shards saw the same tree"""
+    digest = hashlib.blake2b(digest_size=16)
+    for relative_path in relative_paths:
+        digest.update(relative_path.replace(os.sep, "/").encode("utf-8", "surrogateescape") + b"\0")
+    return digest.hexdigest()
+
+def write_shard_manifest(path: str, index: int, count: int, discovered: List[str], positions: List[int],
+                         data_filename: str, data_format: str, rules: Optional[FooterRuleSet] = None):
+    """Record where a shard's results belong in the full discovery order
+
+    discovered holds the sorted relative paths of every README the run found.
+    """
+    manifest = {
+        "shard": index,
+        "shards": count,
+        "discovered": len(discovered),
+        "tree": tree_digest(discovered),
+        "positions": positions,
+        "data": data_filename,
+        "format": data_format,
+        "analyzer_version": ANALYZER_VERSION,
+        "rules": rules.fingerprint if rules is not None else None,
+    }
+    _atomic_write_text(path, json.dumps(manifest))
+
+def merge_shards(manifest_paths: List[str]) -> List[Tuple[str, Dict]]:
+    """Combine the partial results of all shards in single-run discovery order
+
+    Every shard of one run must be present exactly once, and all of them
+    must agree on the analyzer version, rules and discovered files;
+    otherwise ValueError is raised.
+    """
+    manifests = []
+    for path in manifest_paths:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        manifest["data"] = os.path.join(os.path.dirname(path), manifest["data"])
+        manifests.append(manifest)
+    if not manifests:
+        raise ValueError("no shard manifests given")
+    
+    first = manifests[0]
+    for key in ("shards", "discovered", "tree", "analyzer_version", "rules"):
+        values = {json.dumps(manifest.get(key)) for manifest in manifests}
+        if len(values) > 1:
+            raise ValueError(f"shards disagree on {key}: {', '.join(sorted(values))}")
+    shards = sorted(manifest["shard"] for manifest in manifests)
+    if shards != list(range(1, first["shards"] + 1)):
+        raise ValueError(f"expected shards 1..{first['shards']} exactly once, got {shards}")
+    
+    merged = [None] * first["discovered"]
+    for manifest in manifests:
+        records = list(iter_ndjson_results(manifest["data"]) if manifest["format"] == "ndjson"
+                       else load_results(manifest["data"]).items())
+        if len(records) != len(manifest["positions"]):
+            raise ValueError(f"{manifest['data']} holds {len(records)} results, "
+                             f"its manifest lists {len(manifest['positions'])}")
+        for position, record in zip(manifest["positions"], records):
+            if merged[position] is not None:
+                raise ValueError(f"discovery position {position} claimed by more than one shard")
+            merged[position] = record
+    missing = merged.count(None)
+    if missing:
+        raise ValueError(f"{missing} discovered README files are missing from the shards")
+    return merged
+
+def run_merge(args: argparse.Namespace) -> int:
+    """Merge shard results into the final data file and report"""
+    try:
+        results = dict(merge_shards(args.manifests))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Could not merge shards: {e}")
+        return 1
+    
+    base_path = args.base_path
+    stats = write_outputs(base_path, results, args.data_format)
+    if not args.no_history:
+        history = FooterHistory(args.history_path or os.path.join(base_path, HISTORY_FILENAME))
+        try:
+            history.record_run(base_path, results.items())
+        finally:
+            history.close()
+    
+    print(f"🧩 Merged {len(args.manifests)} shards")
+    print(f"📄 Report saved to: {REPORT_FILENAME}")
+    print(f"📊 Data saved to: {DATA_FILENAMES[args.data_format]}")
+    print(f"\n📈 Quick Summary:")
+    print(f"   - Total files: {stats.total_files}")
+    print(f"   - Files with tiation.github.io: {stats.counts['has_tiation_link']}")
+    print(f"   - Coverage: {stats.percent('has_tiation_link'):.1f}%")
+    return 0
+
+class FooterHistory:
+    """Append-only SQLite history of validation runs
+
+    Each run gets a row in runs, one row per README in files and one row
+    per set flag in flags. files is keyed by (run_id, path) and flags by
+    (flag, run_id, path), which serve per-run lookups and per-flag trends
+    respectively. A run is written in a single transaction: begin_run()
+    opens it, add() queues rows in batches and finish_run() commits.
+    """
+    
+    BATCH_SIZE = 1000
+    
+    def __init__(self, db_path: str):
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS runs (
+                run_id INTEGER PRIMARY KEY,
+                started_at TEXT NOT NULL,
+                base_path TEXT NOT NULL,
+                total_files INTEGER
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                run_id INTEGER NOT NULL,
+                path TEXT NOT NULL,
+                content_length INTEGER,
+                error TEXT,
+                PRIMARY KEY (run_id, path)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS flags (
+                flag TEXT NOT NULL,
+                run_id INTEGER NOT NULL,
+                path TEXT NOT NULL,
+                PRIMARY KEY (flag, run_id, path)
+            ) WITHOUT ROWID;
+        """)
+        self.run_id = None
+        self._files = []
+        self._flags = []
+        self._count = 0
+    
+    def begin_run(self, base_path: str) -> int:
+        """Start a run; rows stay uncommitted until finish_run"""
+        cursor = self.conn.execute("INSERT INTO runs (started_at, base_path) VALUES (?, ?)",
+                                   (time.strftime("%Y-%m-%dT%H:%M:%S"), base_path))
+        self.run_id = cursor.lastrowid
+        self._count = 0
+        return self.run_id
+    
+    def add(self, relative_path: str, result: Dict):
+        """Queue one README result for the current run"""
+        self._files.append((self.run_id, relative_path, result.get("content_length"), result.get("error")))
+        self._flags.extend((flag, self.run_id, relative_path) for flag in RESULT_FLAGS if result.get(flag))
+        self._count += 1
+        if len(self._files) >= self.BATCH_SIZE:
+            self._flush()
+    
+    def _flush(self):
+        self.conn.executemany("INSERT INTO files VALUES (?, ?, ?, ?)", self._files)
+        self.conn.executemany("INSERT INTO flags VALUES (?, ?, ?)", self._flags)
+        self._files = []
+        self._flags = []
+    
+    def finish_run(self):
+        """Write the remaining rows and commit the run"""
+        self._flush()
+        self.conn.execute("UPDATE runs SET total_files = ? WHERE run_id = ?", (self._count, self.run_id))
+        self.conn.commit()
+    
+    def record_run(self, base_path: str, items) -> int:
+        """Record a complete run from (path, result) pairs"""
+        run_id = self.begin_run(base_path)
+        for relative_path, result in items:
+            self.add(relative_path, result)
+        self.finish_run()
+        return run_id
+    
+    def runs(self) -> List[Tuple]:
+        """(run_id, started_at, base_path, total_files) for every completed run"""
+        return self.conn.execute(
+            "SELECT run_id, started_at, base_path, total_files FROM runs "
+            "WHERE total_files IS NOT NULL ORDER BY run_id").fetchall()
+    
+    def coverage(self, flag: str) -> List[Tuple]:
+        """(run_id, started_at, total_files, files_with_flag) per run"""
+        return self.conn.execute("""
+            SELECT r.run_id, r.started_at, r.total_files,
+                   (SELECT COUNT(*) FROM flags f WHERE f.flag = ? AND f.run_id = r.run_id)
+            FROM runs r WHERE r.total_files IS NOT NULL ORDER BY r.run_id
+        """, (flag,)).fetchall()
+    
+    def first_regressions(self, flag: str, path: Optional[str] = None) -> List[Tuple]:
+        """(path, run_id, started_at) of the first run where each file lost the flag"""
+        return self.conn.execute("""
+            WITH states AS (
+                SELECT fi.path, fi.run_id,
+                       EXISTS (SELECT 1 FROM flags fl WHERE fl.flag = :flag
+                               AND fl.run_id = fi.run_id AND fl.path = fi.path) AS has_flag
+                FROM files fi
+                WHERE :path IS NULL OR fi.path = :path
+            ), transitions AS (
+                SELECT path, run_id, has_flag,
+                       LAG(has_flag) OVER (PARTITION BY path ORDER BY run_id) AS had_flag
+                FROM states
+            )
+            SELECT t.path, MIN(t.run_id), r.started_at
+            FROM transitions t JOIN runs r ON r.run_id = t.run_id
+            WHERE t.had_flag = 1 AND t.has_flag = 0
+            GROUP BY t.path ORDER BY t.path
+        """, {"flag": flag, "path": path}).fetchall()
+    
+    def close(self):
+        """Close the database, discarding an unfinished run"""
+        self.conn.close()
+
+def run_history(args: argparse.Namespace) -> int:
+    """Answer history queries from the run database"""
+    history_path = args.history_path or os.path.join(args.base_path, HISTORY_FILENAME)
+    if not os.path.exists(history_path):
+        print(f"❌ No history database at {history_path}")
+        return 1
+    
+    history = FooterHistory(history_path)
+    try:
+        if args.query == "runs":
+            print("🗂️  Recorded runs:")
+            for run_id, started_at, base_path, total_files in history.runs():
+                print(f"   - #{run_id} {started_at}: {total_files} files ({base_path})")
+        elif args.query == "coverage":
+            print(f"📈 Coverage of {args.flag} over time:")
+            for run_id, started_at, total_files, with_flag in history.coverage(args.flag):
+                print(f"   - #{run_id} {started_at}: {with_flag}/{total_files} "
+                      f"({with_flag / max(total_files, 1) * 100:.1f}%)")
+        else:
+            regressions = history.first_regressions(args.flag, args.path)
+            print(f"📉 First run each file lost {args.flag}: {len(regressions)} files")
+            for path, run_id, started_at in regressions:
+                print(f"   - {path}: run #{run_id} ({started_at})")
+    finally:
+        history.close()
+    return 0
+
+def diff_results(old: Dict, new: Dict, flags: Tuple[str, ...] = RESULT_FLAGS) -> Dict[str, List]:
+    """Align two result sets by path with a sorted merge and classify the changes
+
+    Returns lists of (path, flag) regressions (True -> False) and
+    improvements (False -> True), (path, error) for files that started
+    failing, and the added and removed paths.
+    """
+    changes = {"regressions": [], "improvements": [], "errors": [], "added": [], "removed": []}
+    old_paths = sorted(old)
+    new_paths = sorted(new)
+    i = j = 0
+    while i < len(old_paths) or j < len(new_paths):
+        if j == len(new_paths) or (i < len(old_paths) and old_paths[i] < new_paths[j]):
+            changes["removed"].append(old_paths[i])
+            i += 1
+            continue
+        if i == len(old_paths) or new_paths[j] < old_paths[i]:
+            changes["added"].append(new_paths[j])
+            j += 1
+            continue
+        
+        path = old_paths[i]
+        before, after = old[path], new[path]
+        i += 1
+        j += 1
+        if after.get("error"):
+            if not before.get("error"):
+                changes["errors"].append((path, after["error"]))
+            continue
+        for flag in flags:
+            was, now = bool(before.get(flag)), bool(after.get(flag))
+            if was and not now:
+                changes["regressions"].append((path, flag))
+            elif now and not was:
+                changes["improvements"].append((path, flag))
+    return changes
+
+def print_diff(changes: Dict[str, List], old_path: str, new_path: str):
+    """Print a diff_results summary"""
+    print(f"🔀 Comparing {old_path} → {new_path}")
+    print(f"   - Added files: {len(changes['added'])}")
+    print(f"   - Removed files: {len(changes['removed'])}")
+    
+    if changes["errors"]:
+        print(f"\n❌ New read errors ({len(changes['errors'])}):")
+        for path, error in changes["errors"]:
+            print(f"   - {path}: {error}")
+    if changes["regressions"]:
+        print(f"\n❌ Regressions ({len(changes['regressions'])}):")
+        for path, flag in changes["regressions"]:
+            print(f"   - {path}: lost {flag}")
+    if changes["improvements"]:
+        print(f"\n✅ Improvements ({len(changes['improvements'])}):")
+        for path, flag in changes["improvements"]:
+            print(f"   - {path}: gained {flag}")
+    if not changes["errors"] and not changes["regressions"]:
+        print("\n✅ No regressions")
+
+def run_diff(args: argparse.Namespace) -> int:
+    """Compare two result files, returning 1 if anything regressed"""
+    try:
+        old = load_results(args.old)
+        new = load_results(args.new)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load results: {e}")
+        return 2
+    flags = tuple(args.flag) if args.flag else RESULT_FLAGS
+    changes = diff_results(old, new, flags)
+    print_diff(changes, args.old, args.new)
+    return 1 if changes["regressions"] or changes["errors"] else 0
+
+def run_report(args: argparse.Namespace) -> int:
+    """Regenerate the markdown report from a saved data file
+
+    Duplicate groups are not kept in data files, so that section is left out.
+    """
+    data_path = args.data or os.path.join(args.base_path, DATA_FILENAMES[args.data_format])
+    start = time.perf_counter()
+    try:
+        stats = load_stats(data_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load results: {e}")
+        return 1
+    load_time = time.perf_counter() - start
+    write_report(os.path.join(args.base_path, REPORT_FILENAME), stats)
+    
+    print(f"📄 Report saved to: {REPORT_FILENAME} ({stats.total_files} files from {data_path}, "
+          f"loaded in {load_time * 1000:.1f}ms)")
+    print(f"   - Coverage: {stats.percent('has_tiation_link'):.1f}%")
+    return 0
+
+def _history_options(argument_default=None) -> argparse.ArgumentParser:
+    """Parent parser holding the history options shared by runs and the merge subcommand"""
+    options = argparse.ArgumentParser(add_help=False, argument_default=argument_default)
+    options.add_argument("--no-history", action="store_true",
+                         help="Do not append this run to the history database")
+    options.add_argument("--history-path",
+                         help=f"History database (default: <base-path>/{HISTORY_FILENAME})")
+    return options
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Validate README footers across Tiation repositories",
+                                     parents=[_history_options()])
+    parser.add_argument("--base-path", default=DEFAULT_BASE_PATH,
+                        help="Workspace root to scan for README files")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Number of worker threads used to analyze files")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-analyze every file instead of reusing cached results")
+    parser.add_argument("--cache-path", default=None,
+                        help=f"Cache database (default: <base-path>/{CACHE_FILENAME})")
+    parser.add_argument("--cache-ttl-days", type=float, default=30,
+                        help="Evict cache entries for files not seen for this many days")
+    parser.add_argument("--tail-only", action="store_true",
+                        help="Memory-map files and run footer checks on the tail window only")
+    parser.add_argument("--tail-bytes", type=int, default=TAIL_WINDOW_BYTES,
+                        help="Size of the tail window used by --tail-only")
+    parser.add_argument("--discovery", choices=sorted(DISCOVERY_BACKENDS), default="walk",
+                        help="How README files are found: full directory walk or git index")
+    parser.add_argument("--since", metavar="GIT_REF", default=None,
+                        help="Only validate READMEs changed since this ref and merge into the existing data "
+                             "(a full run when there is no data file yet)")
+    parser.add_argument("--watch", action="store_true",
+                        help="After the initial run, keep the outputs updated as READMEs change (Linux)")
+    parser.add_argument("--debounce", type=float, default=0.2,
+                        help="Seconds of quiet before --watch re-validates changed files")
+    parser.add_argument("--format", choices=sorted(DATA_FILENAMES), default="json", dest="data_format",
+                        help=f"Write {DATA_FILENAME}, stream records to {NDJSON_FILENAME} as they are "
+                             f"analyzed, or write the compact columnar {BINARY_FILENAME}")
+    
+    commands = parser.add_subparsers(dest="command")
+    diff_parser = commands.add_parser("diff", help="Compare two result files and report flag regressions")
+    diff_parser.add_argument("old", help="Earlier result file (.json, .ndjson or .bin)")
+    diff_parser.add_argument("new", help="Later result file (.json, .ndjson or .bin)")
+    diff_parser.add_argument("--flag", action="append", choices=RESULT_FLAGS,
+                             help="Only compare this flag (repeatable; default: all flags)")
+    
+    report_parser = commands.add_parser("report", help="Regenerate the report from a saved data file")
+    report_parser.add_argument("data", nargs="?", default=None,
+                               help="Result file (.json, .ndjson or .bin; default: the --format data file "
+                                    "in --base-path)")
+    
+    # Suppressed defaults keep options given before "merge" from being reset by the subcommand
+    merge_parser = commands.add_parser("merge", help="Combine --shard partial results into the final data and report",
+                                       parents=[_history_options(argparse.SUPPRESS)])
+    merge_parser.add_argument("manifests", nargs="+",
+                              help=f"Shard manifests ({shard_filename(MANIFEST_FILENAME, 1, 'N')} ...)")
+    
+    history_parser = commands.add_parser("history", help="Query the history of recorded runs")
+    history_parser.add_argument("query", choices=["runs", "coverage", "regressions"],
+                                help="List runs, show flag coverage per run, or find each file's first regression")
+    history_parser.add_argument("--flag", choices=RESULT_FLAGS, default="has_tiation_link",
+                                help="Flag to report on (default: has_tiation_link)")
+    history_parser.add_argument("--path", default=None,
+                                help="Limit regressions to one README path")
+    parser.add_argument("--dedup", action="store_true",
+                        help="Analyze identical README copies once and report the duplicate groups")
+    parser.add_argument("--rules", metavar="PATH", default=None,
+                        help="JSON footer rule file to check every README against (e.g. footer_rules.json)")
+    parser.add_argument("--fix", action="store_true",
+                        help=f"Append or replace the canonical footer in READMEs missing the link or NGO mention "
+                             f"and save the changes as {FIX_DIFF_FILENAME}")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="With --fix, print the unified diff instead of writing any README")
+    parser.add_argument("--exclude-file", default=DEFAULT_EXCLUDE_FILE,
+                        help="Global exclude patterns (gitignore syntax) for the directory walk "
+                             "(default: .walkignore next to this script)")
+    parser.add_argument("--no-gitignore", action="store_true",
+                        help="Do not prune paths listed in each directory's .gitignore")
+    parser.add_argument("--shard", type=parse_shard, default=None, metavar="I/N",
+                        help="Only validate the READMEs whose path hash falls in shard I of N and write "
+                             "partial results for the merge subcommand")
+    parser.add_argument("--slowest", type=int, default=10,
+                        help="Number of slowest files to list in the summary and metrics")
+    parser.add_argument("--metrics-out", metavar="PATH", default=None,
+                        help="Write phase timings and counts as a Prometheus textfile-collector file")
+    return parser.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
     """Main execution function"""
-    base_path = "/Users/tiaastor/Github/tiation-repos"
+    args = parse_args(argv)
+    if args.command == "diff":
+        return run_diff(args)
+    if args.command == "history":
+        return run_history(args)
+    if args.command == "merge":
+        return run_merge(args)
+    if args.command == "report":
+        return run_report(args)
+    if args.shard and (args.since or args.watch):
+        print("❌ --shard cannot be combined with --since or --watch")
+        return 1
     
-    print("🔍 Validating README footers across all repositories...")
-    results = validate_all_footers(base_path)
+    base_path = args.base_path
+    worker_stats = {}
+    tail_bytes = args.tail_bytes if args.tail_only else None
+    rules = None
+    if args.rules:
+        if tail_bytes is not None:
+            print("❌ --rules needs the full README content and cannot be combined with --tail-only")
+            return 1
+        try:
+            rules = FooterRuleSet.load(args.rules)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load footer rules: {e}")
+            return 1
+    cache = None
+    if not args.no_cache:
+        variant = "full" if tail_bytes is None else f"tail:{tail_bytes}"
+        if rules is not None:
+            variant += f"+rules:{rules.fingerprint}"
+        cache = FooterCache(args.cache_path or os.path.join(base_path, CACHE_FILENAME),
+                            ttl_days=args.cache_ttl_days, variant=variant)
     
-    print("📊 Generating validation report...")
-    report = generate_report(results)
+    data_filename = DATA_FILENAMES[args.data_format]
+    data_path = os.path.join(base_path, data_filename)
+    readme_files = None
+    removed = []
+    metrics = ValidationMetrics(slowest=max(args.slowest, 0))
+    walker = WorkspaceWalker(exclude_file=args.exclude_file, use_gitignore=not args.no_gitignore)
+    since = args.since
+    if since and not os.path.exists(data_path):
+        # Nothing to merge the changed READMEs into, so only a full run gives complete data
+        print(f"⚠️  No {data_filename} to merge into; validating all READMEs instead of changes since {since}")
+        since = None
+    if since:
+        try:
+            phase_start = time.perf_counter()
+            readme_files, removed = changed_readme_files(base_path, since, walker)
+            metrics.add_phase("discovery", time.perf_counter() - phase_start)
+        except (OSError, subprocess.SubprocessError) as e:
+            print(f"❌ Could not diff against {since}: {e}")
+            return 1
+        print(f"🔍 Validating {len(readme_files)} README files changed since {since}...")
+    elif args.shard:
+        index, count = args.shard
+        phase_start = time.perf_counter()
+        discovered = discover_readme_files(base_path, args.discovery, walker)
+        relative_paths = [os.path.relpath(file_path, base_path) for file_path in discovered]
+        positions = [i for i, relative_path in enumerate(relative_paths) if shard_of(relative_path, count) == index]
+        readme_files = [discovered[i] for i in positions]
+        metrics.add_phase("discovery", time.perf_counter() - phase_start)
+        data_filename = shard_filename(data_filename, index, count)
+        data_path = os.path.join(base_path, data_filename)
+        print(f"🧩 Shard {index}/{count}: validating {len(readme_files)} of {len(discovered)} README files...")
+    else:
+        print("🔍 Validating README footers across all repositories...")
     
-    # Save results
-    with open("/Users/tiaastor/Github/tiation-repos/footer_validation_report.md", "w", encoding="utf-8") as f:
-        f.write(report)
+    dedup = DuplicateIndex() if args.dedup else None
+    history = None
+    # Shards leave the history to the merge, which sees the whole run
+    if not args.no_history and not args.shard:
+        history = FooterHistory(args.history_path or os.path.join(base_path, HISTORY_FILENAME))
+    start = time.perf_counter()
+    streamed = args.data_format in DATA_WRITERS and not since
+    fix_candidates = []
+    try:
+        records = iter_footer_results(base_path, jobs=max(args.jobs, 1),
+                                      worker_stats=worker_stats, cache=cache,
+                                      tail_bytes=tail_bytes, discovery=args.discovery,
+                                      readme_files=readme_files, dedup=dedup, rules=rules,
+                                      metrics=metrics, walker=walker)
+        if streamed:
+            # Records go straight to the writer and into the statistics, never into a dict
+            stats = FooterStats()
+            if history is not None:
+                history.begin_run(base_path)
+            with DATA_WRITERS[args.data_format](data_path) as writer:
+                for relative_path, result in records:
+                    writer.write(relative_path, result)
+                    stats.add(relative_path, result)
+                    if history is not None:
+                        history.add(relative_path, result)
+                    if args.fix and needs_footer_fix(result):
+                        fix_candidates.append(relative_path)
+            if history is not None:
+                history.finish_run()
+        else:
+            results = dict(records)
+            if since:
+                results = merge_results(load_results(data_path), results, removed)
+            if history is not None:
+                history.record_run(base_path, results.items())
+            if args.fix:
+                fix_candidates = [path for path, result in results.items() if needs_footer_fix(result)]
+    finally:
+        if cache is not None:
+            cache.close()
+        if history is not None:
+            history.close()
+    wall_time = time.perf_counter() - start
     
-    with open("/Users/tiaastor/Github/tiation-repos/footer_validation_data.json", "w", encoding="utf-8") as f:
-        json.dump(results, f, indent=2)
+    phase_start = time.perf_counter()
+    duplicate_groups = dedup.groups() if dedup is not None else None
+    if args.shard:
+        if not streamed:
+            write_data(data_path, results, args.data_format)
+            stats = FooterStats().update(results.items())
+        manifest_filename = shard_filename(MANIFEST_FILENAME, *args.shard)
+        write_shard_manifest(os.path.join(base_path, manifest_filename), *args.shard, relative_paths,
+                             positions, data_filename, args.data_format, rules)
+    else:
+        print("📊 Generating validation report...")
+        if streamed:
+            write_report(os.path.join(base_path, REPORT_FILENAME), stats, duplicate_groups)
+        else:
+            stats = write_outputs(base_path, results, args.data_format, duplicate_groups)
+    metrics.add_phase("report", time.perf_counter() - phase_start)
     
     print("✅ Validation complete!")
-    print(f"📄 Report saved to: footer_validation_report.md")
-    print(f"📊 Data saved to: footer_validation_data.json")
+    if args.shard:
+        print(f"🧩 Manifest saved to: {manifest_filename}")
+    else:
+        print(f"📄 Report saved to: {REPORT_FILENAME}")
+    print(f"📊 Data saved to: {data_filename}")
     
     # Print quick summary
-    total_files = len(results)
-    files_with_tiation_link = sum(1 for r in results.values() if r.get("has_tiation_link", False))
     print(f"\n📈 Quick Summary:")
-    print(f"   - Total files: {total_files}")
-    print(f"   - Files with tiation.github.io: {files_with_tiation_link}")
-    print(f"   - Coverage: {files_with_tiation_link/total_files*100:.1f}%")
+    print(f"   - Total files: {stats.total_files}")
+    print(f"   - Files with tiation.github.io: {stats.counts['has_tiation_link']}")
+    print(f"   - Coverage: {stats.percent('has_tiation_link'):.1f}%")
+    if cache is not None:
+        print(f"   - Cache: {cache.hits} hits / {cache.misses} misses")
+    if walker.visited:
+        print(f"   - Directories: {walker.visited} visited / {walker.pruned} pruned")
+    if duplicate_groups:
+        print(f"   - Duplicate groups: {len(duplicate_groups)} "
+              f"({sum(group['bytes_saved'] for group in duplicate_groups):,} bytes not re-analyzed)")
+    if rules is not None:
+        failing = sum(stats.rule_failures.values())
+        print(f"   - Rule failures: {failing} across {len(stats.rule_failures)} of {len(rules.rules)} rules")
+    
+    print_worker_summary(worker_stats, wall_time)
+    print_metrics_summary(metrics)
+    if args.metrics_out:
+        _atomic_write_text(args.metrics_out, metrics.to_prometheus(stats, wall_time, cache))
+        print(f"📡 Metrics saved to: {args.metrics_out}")
+    
+    if args.fix:
+        start = time.perf_counter()
+        fixes = fix_footers(base_path, fix_candidates, dry_run=args.dry_run, jobs=max(args.jobs, 1))
+        if args.dry_run:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(fixes["diff"].encode("utf-8", "surrogateescape"))
+            sys.stdout.buffer.flush()
+            print(f"\n🔧 Dry run: {fixes['files']} READMEs in {fixes['repositories']} repositories would be fixed")
+        else:
+            print(f"\n🔧 Fixed {fixes['files']} READMEs in {fixes['repositories']} repositories "
+                  f"in {time.perf_counter() - start:.3f}s")
+            if fixes["diff"]:
+                _atomic_write_text(os.path.join(base_path, FIX_DIFF_FILENAME), fixes["diff"], "surrogateescape")
+                print(f"📝 Changes saved to: {FIX_DIFF_FILENAME}")
+            if fixes["files"]:
+                print("ℹ️  The report, data file and history were written before fixing and still describe "
+                      "the old footers; run the validator again to record the fixed READMEs")
+        for path, error in sorted(fixes["failed"].items()):
+            print(f"   ❌ {path}: {error}")
+        if fixes["failed"]:
+            return 1
+    
+    if args.watch:
+        if not sys.platform.startswith("linux"):
+            print("❌ --watch requires Linux inotify")
+            return 1
+        if streamed:
+            results = load_results(data_path)
+        watch_footers(base_path, results, debounce=args.debounce, tail_bytes=tail_bytes,
+                      data_format=args.data_format, rules=rules, walker=walker)
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Workspace Walker
+Shared os.scandir-based tree walker for the workspace tooling
+
+Directories are pruned at descent time using a global exclude file and each
+directory's .gitignore (gitignore syntax: comments, !negation, trailing /
+for directories, anchored patterns and **). Entries are classified from the
+d_type scandir already returned, so regular files and directories are never
+stat'ed; only symlinks need a stat to tell where they point.
+"""
+
+import copy
+import os
+import re
+from typing import Callable, Iterator, List, Optional, Tuple
+
+DEFAULT_EXCLUDE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".walkignore")
+# Used when no exclude file is available
+DEFAULT_EXCLUDES = (".git/", "node_modules/", ".archive/")
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob into a regex over /-separated paths"""
+    out = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("/**", i) and i + 3 == len(pattern):
+            out.append("/.*")
+            i += 3
+            continue
+        if c == "*":
+            out.append(".*" if pattern.startswith("**", i) else "[^/]*")
+            i += 2 if pattern.startswith("**", i) else 1
+            continue
+        if c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end
+        elif c == "\\" and i + 1 < len(pattern):
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+def _parse_ignore_lines(lines: List[str]) -> List[Tuple[str, bool, bool, bool]]:
+    """(pattern, negate, dir_only, anchored) for each rule line of an ignore file"""
+    rules = []
+    for line in lines:
+        line = line.rstrip("\n").rstrip("\r")
+        if not line.endswith("\\ "):
+            line = line.rstrip(" ")
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\"):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        rules.append((line.lstrip("/"), negate, dir_only, anchored))
+    return rules
+
+def _compile_group(rules: List[Tuple[str, bool, bool, bool]], is_dir: bool) -> Tuple:
+    """Name set, name regex and path regex matching any of rules for a directory or a file"""
+    names = set()
+    name_patterns = []
+    path_patterns = []
+    for pattern, _, dir_only, anchored in rules:
+        if dir_only and not is_dir:
+            continue
+        if anchored:
+            path_patterns.append(_glob_to_regex(pattern))
+        elif not re.search(r"[*?\[\\]", pattern):
+            names.add(pattern)
+        else:
+            name_patterns.append(_glob_to_regex(pattern))
+    
+    def combined(patterns):
+        return re.compile("|".join(f"(?:{p})" for p in patterns)) if patterns else None
+    return names, combined(name_patterns), combined(path_patterns)
+
+class IgnoreRules:
+    """An ordered, immutable chain of compiled ignore files
+
+    Every ignore file becomes one block; rules from deeper .gitignore files
+    come later and win, as in git. Within a block, consecutive rules of the
+    same polarity are folded into one set of plain names plus one combined
+    regex each for name and path patterns, so a lookup costs a few regex
+    calls per block however long the files are. Unanchored patterns match
+    the entry name; anchored ones match the path below the block's
+    directory.
+    """
+    
+    # Repositories created from the same template share their .gitignore
+    _compiled = {}
+    
+    def __init__(self, blocks: Tuple = ()):
+        self.blocks = blocks
+    
+    def extend(self, base: str, lines: List[str]) -> "IgnoreRules":
+        """Rules with the patterns of an ignore file in directory base (relative, '' for the root) appended"""
+        key = tuple(lines)
+        groups = self._compiled.get(key)
+        if groups is None:
+            groups = self._compiled[key] = self._compile(_parse_ignore_lines(lines))
+        if not groups:
+            return self
+        return IgnoreRules(self.blocks + ((len(base) + 1 if base else 0, groups),))
+    
+    @staticmethod
+    def _compile(rules: List[Tuple[str, bool, bool, bool]]) -> Tuple:
+        """Fold runs of same-polarity rules into groups, last group first"""
+        groups = []
+        start = 0
+        for i in range(1, len(rules) + 1 if rules else 0):
+            if i == len(rules) or rules[i][1] != rules[start][1]:
+                chunk = rules[start:i]
+                groups.append((chunk[0][1], _compile_group(chunk, True), _compile_group(chunk, False)))
+                start = i
+        # Later groups win, so they are tried first
+        groups.reverse()
+        return tuple(groups)
+    
+    def ignored(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        """Whether a /-separated path relative to the walk root is excluded"""
+        for prefix, groups in reversed(self.blocks):
+            for negate, dir_group, file_group in groups:
+                names, name_regex, path_regex = dir_group if is_dir else file_group
+                if (name in names
+                        or (name_regex is not None and name_regex.fullmatch(name))
+                        or (path_regex is not None and path_regex.fullmatch(rel_path, prefix))):
+                    return not negate
+        return False
+
+def read_ignore_file(path: str) -> Optional[List[str]]:
+    """Lines of an ignore file, or None if it cannot be read"""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.readlines()
+    except OSError:
+        return None
+
+class WorkspaceWalker:
+    """Depth-first os.scandir walk that prunes excluded directories before entering them
+
+    Entries are yielded directory by directory in listing order with
+    subdirectories visited afterwards, the same order as os.walk. Symlinked
+    directories are reported but not followed. visited and pruned count the
+    directories entered and skipped by the last walk, so concurrent walks
+    each need their own copy(). is_excluded applies the same rules to paths
+    found some other way (git, inotify).
+    """
+
+    def __init__(self, exclude_file: Optional[str] = DEFAULT_EXCLUDE_FILE,
+                 excludes: Optional[List[str]] = None, use_gitignore: bool = True):
+        lines = read_ignore_file(exclude_file) if exclude_file else None
+        if lines is None:
+            lines = list(DEFAULT_EXCLUDES)
+        self.rules = IgnoreRules().extend("", lines + list(excludes or ()))
+        self.use_gitignore = use_gitignore
+        self.visited = 0
+        self.pruned = 0
+        # (root, relative directory) -> rules in effect inside it, or None if it is excluded
+        self._dir_rules = {}
+
+    def copy(self) -> "WorkspaceWalker":
+        """A walker with the same compiled rules but its own counters, for a concurrent walk"""
+        walker = copy.copy(self)
+        walker.visited = 0
+        walker.pruned = 0
+        walker._dir_rules = {}
+        return walker
+
+    def iter_files(self, root: str, match: Optional[Callable[[str], bool]] = None) -> Iterator[str]:
+        """Yield the paths of non-excluded files under root whose name satisfies match"""
+        for entry, is_dir in self.iter_entries(root, match):
+            if not is_dir:
+                yield entry.path
+
+    def iter_entries(self, root: str, match: Optional[Callable[[str], bool]] = None,
+                     start: str = "") -> Iterator[Tuple[os.DirEntry, bool]]:
+        """Yield (entry, is_dir) for non-excluded directories and files under root
+
+        Only files whose name satisfies match are reported (and checked
+        against the ignore rules); directories are always reported. A start
+        directory (/-separated, relative to root) limits the walk to that
+        subtree, with the rules of root and every directory above it; an
+        excluded start yields nothing.
+        """
+        self.visited = 0
+        self.pruned = 0
+        self._dir_rules.clear()
+        rules = self.rules
+        if start:
+            # The walk reads start's own .gitignore, so begin with the rules of its parent
+            parent, _, name = start.rpartition("/")
+            rules = self._rules_for(root, parent)
+            if rules is None or rules.ignored(start, name, True):
+                return
+        stack = [(os.path.join(root, *start.split("/")) if start else root, start, rules)]
+        while stack:
+            current, rel_dir, rules = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            self.visited += 1
+
+            if self.use_gitignore:
+                for entry in entries:
+                    if entry.name == ".gitignore":
+                        lines = read_ignore_file(entry.path)
+                        if lines:
+                            rules = rules.extend(rel_dir, lines)
+                        break
+
+            subdirs = []
+            for entry in entries:
+                name = entry.name
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if rules.ignored(rel_path, name, True):
+                        self.pruned += 1
+                        continue
+                    yield entry, True
+                    if not entry.is_symlink():
+                        subdirs.append((entry.path, rel_path, rules))
+                elif (match is None or match(name)) and not rules.ignored(rel_path, name, False):
+                    yield entry, False
+            stack.extend(reversed(subdirs))
+
+    def is_excluded(self, root: str, rel_path: str, is_dir: bool = False) -> bool:
+        """Whether a /-separated path relative to root would be skipped by a walk of root
+
+        A path is excluded when it or any directory above it matches the
+        exclude file or, with use_gitignore, a .gitignore on the way down.
+        The ignore files read are remembered until the next walk.
+        """
+        parent, _, name = rel_path.rpartition("/")
+        rules = self._rules_for(root, parent)
+        return rules is None or rules.ignored(rel_path, name, is_dir)
+
+    def _rules_for(self, root: str, rel_dir: str) -> Optional[IgnoreRules]:
+        """Rules in effect inside a directory relative to root, or None if it is excluded"""
+        key = (root, rel_dir)
+        if key in self._dir_rules:
+            return self._dir_rules[key]
+        if rel_dir:
+            parent, _, name = rel_dir.rpartition("/")
+            rules = self._rules_for(root, parent)
+            if rules is not None and rules.ignored(rel_dir, name, True):
+                rules = None
+        else:
+            rules = self.rules
+        if rules is not None and self.use_gitignore:
+            lines = read_ignore_file(os.path.join(root, *rel_dir.split("/"), ".gitignore") if rel_dir
+                                     else os.path.join(root, ".gitignore"))
+            if lines:
+                rules = rules.extend(rel_dir, lines)
+        self._dir_rules[key] = rules
+        return rules